@@ -0,0 +1,282 @@
+from chess_game.enums import Colour, PieceType
+from typing import List, Optional, Tuple
+
+# Squares are indexed as `row * 8 + col`, matching the layout of `GameState.board`: bit 0 is a8 and bit 63 is h1.
+WHITE = 0
+BLACK = 1
+COLOUR_INDEX = {Colour.WHITE: WHITE, Colour.BLACK: BLACK}
+
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+PIECE_TYPES = (PieceType.PAWN, PieceType.KNIGHT, PieceType.BISHOP,
+               PieceType.ROOK, PieceType.QUEEN, PieceType.KING)
+PIECE_INDEX = {piece_type: index for index, piece_type in enumerate(PIECE_TYPES)}
+
+FULL_BOARD = (1 << 64) - 1
+# The first and last rows (ranks 8 and 1), where pawns promote
+PROMOTION_RANKS = 0xFF | (0xFF << 56)
+
+
+def square(row: int, col: int) -> int:
+    """Returns the bitboard square index of (row, col)."""
+    return row * 8 + col
+
+
+def to_row_col(sq: int) -> Tuple[int, int]:
+    """Returns the (row, col) of a bitboard square index."""
+    return sq >> 3, sq & 7
+
+
+def lsb(bb: int) -> int:
+    """Returns the index of the least significant set bit of a non-empty bitboard."""
+    return (bb & -bb).bit_length() - 1
+
+
+def iter_squares(bb: int):
+    """Yields the square index of every set bit, lowest first."""
+    while bb:
+        low = bb & -bb
+        yield low.bit_length() - 1
+        bb ^= low
+
+
+def _step_table(offsets: List[Tuple[int, int]]) -> List[int]:
+    """Builds a table of single-step target masks (knight, king) for every square."""
+    table = []
+    for row in range(8):
+        for col in range(8):
+            mask = 0
+            for dr, dc in offsets:
+                r, c = row + dr, col + dc
+                if 0 <= r < 8 and 0 <= c < 8:
+                    mask |= 1 << square(r, c)
+            table.append(mask)
+    return table
+
+
+def _ray_table(dr: int, dc: int) -> List[int]:
+    """Builds a table of the squares strictly beyond every square in direction (dr, dc)."""
+    table = []
+    for row in range(8):
+        for col in range(8):
+            mask = 0
+            r, c = row + dr, col + dc
+            while 0 <= r < 8 and 0 <= c < 8:
+                mask |= 1 << square(r, c)
+                r += dr
+                c += dc
+            table.append(mask)
+    return table
+
+
+def _between_table() -> List[List[int]]:
+    """Builds a table of the squares strictly between every pair of squares that share a line (else 0)."""
+    table = [[0] * 64 for _ in range(64)]
+    for row in range(8):
+        for col in range(8):
+            for dr, dc in [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]:
+                mask = 0
+                r, c = row + dr, col + dc
+                while 0 <= r < 8 and 0 <= c < 8:
+                    table[square(row, col)][square(r, c)] = mask
+                    mask |= 1 << square(r, c)
+                    r += dr
+                    c += dc
+    return table
+
+
+KNIGHT_ATTACKS = _step_table([(-2, -1), (-2, 1), (-1, -2), (-1, 2),
+                              (1, -2), (1, 2), (2, -1), (2, 1)])
+KING_ATTACKS = _step_table([(-1, -1), (-1, 0), (-1, 1), (0, -1),
+                            (0, 1), (1, -1), (1, 0), (1, 1)])
+# Squares attacked by a pawn of the given colour standing on each square. White pawns move towards row 0.
+PAWN_ATTACKS = (_step_table([(-1, -1), (-1, 1)]), _step_table([(1, -1), (1, 1)]))
+
+# Each ray is paired with whether it runs towards higher square indices, which decides whether the nearest
+# blocker is the lowest or the highest set bit.
+ORTHOGONAL_RAYS = [(_ray_table(dr, dc), dr * 8 + dc > 0)
+                   for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]]
+DIAGONAL_RAYS = [(_ray_table(dr, dc), dr * 8 + dc > 0)
+                 for dr, dc in [(-1, -1), (-1, 1), (1, -1), (1, 1)]]
+BETWEEN = _between_table()
+
+
+def slider_attacks(sq: int, occupied: int, rays) -> int:
+    """Returns the squares attacked from `sq` along `rays`, stopping at (and including) the first blocker."""
+    attacks = 0
+    for table, positive in rays:
+        ray = table[sq]
+        blockers = ray & occupied
+        if blockers:
+            nearest = lsb(blockers) if positive else blockers.bit_length() - 1
+            ray ^= table[nearest]
+        attacks |= ray
+    return attacks
+
+
+def rook_attacks(sq: int, occupied: int) -> int:
+    return slider_attacks(sq, occupied, ORTHOGONAL_RAYS)
+
+
+def bishop_attacks(sq: int, occupied: int) -> int:
+    return slider_attacks(sq, occupied, DIAGONAL_RAYS)
+
+
+class Bitboards:
+    """
+    A position held as 64-bit integer bitboards: one per piece type and colour, plus an occupancy mask per colour.
+
+    `pieces[colour][piece]` and `occupancy[colour]` are indexed with `WHITE`/`BLACK` and `PAWN`..`KING`.
+    """
+
+    def __init__(self):
+        self.pieces: List[List[int]] = [[0] * 6, [0] * 6]
+        self.occupancy: List[int] = [0, 0]
+
+    @classmethod
+    def from_board(cls, board) -> 'Bitboards':
+        """Builds the bitboards for a `GameState.board` style list of rows of pieces."""
+        bitboards = cls()
+        for row in range(8):
+            for col in range(8):
+                piece = board[row][col]
+                if piece:
+                    bitboards.add(COLOUR_INDEX[piece.colour],
+                                  PIECE_INDEX[piece.piece_type], square(row, col))
+        return bitboards
+
+    @property
+    def occupied(self) -> int:
+        return self.occupancy[WHITE] | self.occupancy[BLACK]
+
+    def add(self, colour: int, piece: int, sq: int) -> None:
+        bit = 1 << sq
+        self.pieces[colour][piece] |= bit
+        self.occupancy[colour] |= bit
+
+    def remove(self, colour: int, piece: int, sq: int) -> None:
+        mask = ~(1 << sq)
+        self.pieces[colour][piece] &= mask
+        self.occupancy[colour] &= mask
+
+    def king_square(self, colour: int) -> Optional[int]:
+        """Returns the square of the `colour` king, or None if it is not on the board."""
+        king = self.pieces[colour][KING]
+        return lsb(king) if king else None
+
+    def is_square_attacked(self, sq: int, by_colour: int, occupied: Optional[int] = None) -> bool:
+        """Returns whether any `by_colour` piece attacks `sq`, given the (optionally overridden) occupancy."""
+        if occupied is None:
+            occupied = self.occupancy[WHITE] | self.occupancy[BLACK]
+        theirs = self.pieces[by_colour]
+        if KNIGHT_ATTACKS[sq] & theirs[KNIGHT]:
+            return True
+        if KING_ATTACKS[sq] & theirs[KING]:
+            return True
+        # A pawn of `by_colour` attacks `sq` if it stands where a pawn of the other colour on `sq` would attack
+        if PAWN_ATTACKS[by_colour ^ 1][sq] & theirs[PAWN]:
+            return True
+        queens = theirs[QUEEN]
+        if rook_attacks(sq, occupied) & (theirs[ROOK] | queens):
+            return True
+        return bool(bishop_attacks(sq, occupied) & (theirs[BISHOP] | queens))
+
+    def checks_and_pins(self, colour: int) -> Tuple[int, dict]:
+        """
+        Works out which of the `colour` player's moves are legal without trying any of them.
+
+        Returns the check mask, the squares a move by any piece other than the king must land on: every square when
+        not in check, the checking piece and the squares between it and the king in single check, and none in double
+        check. Also returns the pins, mapping each pinned piece's square to the squares on its pin line.
+        """
+        king_sq = self.king_square(colour)
+        if king_sq is None:
+            return FULL_BOARD, {}
+        theirs = self.pieces[colour ^ 1]
+        ours = self.occupancy[colour]
+        their_occupancy = self.occupancy[colour ^ 1]
+        occupied = ours | their_occupancy
+
+        checkers = (KNIGHT_ATTACKS[king_sq] & theirs[KNIGHT]) | (PAWN_ATTACKS[colour][king_sq] & theirs[PAWN])
+        check_mask = checkers
+        pins = {}
+        # Enemy sliders that would see the king if none of our pieces were in the way either check or pin
+        queens = theirs[QUEEN]
+        snipers = ((rook_attacks(king_sq, their_occupancy) & (theirs[ROOK] | queens))
+                   | (bishop_attacks(king_sq, their_occupancy) & (theirs[BISHOP] | queens)))
+        for sniper in iter_squares(snipers):
+            between = BETWEEN[king_sq][sniper]
+            blockers = between & occupied
+            if not blockers:
+                checkers |= 1 << sniper
+                check_mask |= between | (1 << sniper)
+            elif not blockers & (blockers - 1):
+                pins[lsb(blockers)] = between | (1 << sniper)
+
+        if not checkers:
+            return FULL_BOARD, pins
+        if checkers & (checkers - 1):
+            return 0, pins
+        return check_mask, pins
+
+    def attacks_from(self, piece: int, colour: int, sq: int, occupied: int) -> int:
+        """Returns the squares a piece attacks from `sq`, ignoring whose pieces stand on them."""
+        if piece == KNIGHT:
+            return KNIGHT_ATTACKS[sq]
+        if piece == KING:
+            return KING_ATTACKS[sq]
+        if piece == PAWN:
+            return PAWN_ATTACKS[colour][sq]
+        if piece == BISHOP:
+            return bishop_attacks(sq, occupied)
+        if piece == ROOK:
+            return rook_attacks(sq, occupied)
+        return rook_attacks(sq, occupied) | bishop_attacks(sq, occupied)
+
+    def pseudo_legal_targets(self, piece: int, colour: int, sq: int) -> int:
+        """
+        Returns the destination squares of the piece on `sq`, not considering checks, en passant or castling.
+
+        :param piece: The piece index (`PAWN`..`KING`) of the piece on `sq`.
+        :param colour: The colour index of the piece on `sq`.
+        :param sq: The square the piece stands on.
+        """
+        occupied = self.occupancy[WHITE] | self.occupancy[BLACK]
+        if piece != PAWN:
+            return self.attacks_from(piece, colour, sq, occupied) & ~self.occupancy[colour]
+
+        targets = PAWN_ATTACKS[colour][sq] & self.occupancy[colour ^ 1]
+        step = -8 if colour == WHITE else 8
+        one = sq + step
+        if 0 <= one < 64 and not occupied & (1 << one):
+            targets |= 1 << one
+            start_row = 6 if colour == WHITE else 1
+            if sq >> 3 == start_row and not occupied & (1 << (one + step)):
+                targets |= 1 << (one + step)
+        return targets
+
+    def leaves_king_safe(self, from_sq: int, to_sq: int, colour: int, captured_sq: Optional[int] = None) -> bool:
+        """
+        Returns whether moving the piece on `from_sq` to `to_sq` leaves the `colour` king unattacked.
+
+        Works purely on the integers, without changing the stored bitboards.
+
+        :param captured_sq: The square of the captured piece when it differs from `to_sq` (en passant).
+        """
+        from_bit = 1 << from_sq
+        to_bit = 1 << to_sq
+        captured_bit = to_bit if captured_sq is None else 1 << captured_sq
+        occupied = ((self.occupancy[WHITE] | self.occupancy[BLACK]) & ~from_bit & ~captured_bit) | to_bit
+        king = self.pieces[colour][KING]
+        king_sq = to_sq if king & from_bit else lsb(king)
+
+        theirs = [bb & ~captured_bit for bb in self.pieces[colour ^ 1]]
+        if KNIGHT_ATTACKS[king_sq] & theirs[KNIGHT]:
+            return False
+        if KING_ATTACKS[king_sq] & theirs[KING]:
+            return False
+        if PAWN_ATTACKS[colour][king_sq] & theirs[PAWN]:
+            return False
+        queens = theirs[QUEEN]
+        if rook_attacks(king_sq, occupied) & (theirs[ROOK] | queens):
+            return False
+        return not bishop_attacks(king_sq, occupied) & (theirs[BISHOP] | queens)
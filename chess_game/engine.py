@@ -0,0 +1,328 @@
+"""
+A negamax alpha-beta search on top of `GameState`, with iterative deepening under a time and/or node budget.
+
+At the horizon a quiescence search plays out captures and promotions until the position is quiet, so that a
+capture just beyond the search depth is not missed.
+"""
+from chess_game.enums import Colour, PieceType
+from chess_game.game import GameState
+from chess_game.move import Move
+from chess_game.move_ordering import MoveOrderer
+from chess_game.transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from typing import Callable, List, Optional
+import time
+
+MATE_SCORE = 100000
+# Scores beyond this are mates, found `MATE_SCORE - abs(score)` plies from the root
+MATE_THRESHOLD = MATE_SCORE - 1000
+MAX_DEPTH = 64
+
+PIECE_VALUES = {
+    PieceType.PAWN: 100,
+    PieceType.KNIGHT: 320,
+    PieceType.BISHOP: 330,
+    PieceType.ROOK: 500,
+    PieceType.QUEEN: 900,
+    PieceType.KING: 0
+}
+
+# Delta pruning: a capture is skipped when even winning the captured piece and this margin on top would not
+# bring the score up to alpha
+DELTA_MARGIN = 200
+
+# How many nodes are searched between checks of the clock and the stop flag
+BUDGET_CHECK_INTERVAL = 256
+
+_PROMOTION_CODES = {None: 0, PieceType.KNIGHT: 1, PieceType.BISHOP: 2, PieceType.ROOK: 3, PieceType.QUEEN: 4}
+
+
+def move_code(move: Move) -> int:
+    """Packs a move's squares and promotion piece into the 16 bits stored in the transposition table."""
+    return ((move.from_row * 8 + move.from_col) | ((move.to_row * 8 + move.to_col) << 6)
+            | (_PROMOTION_CODES[move.promotion] << 12))
+
+
+def score_to_table(score: int, ply: int) -> int:
+    """Converts a mate score from distance-to-root to distance-to-this-node, for storing in the table."""
+    if score >= MATE_THRESHOLD:
+        return score + ply
+    if score <= -MATE_THRESHOLD:
+        return score - ply
+    return score
+
+
+def score_from_table(score: int, ply: int) -> int:
+    """Converts a stored mate score back to distance-to-root at `ply`."""
+    if score >= MATE_THRESHOLD:
+        return score - ply
+    if score <= -MATE_THRESHOLD:
+        return score + ply
+    return score
+
+
+class SearchAborted(Exception):
+    """Raised inside the search when its time or node budget runs out, or it is stopped."""
+    pass
+
+
+class SearchResult:
+    def __init__(self, best_move: Optional[Move], score: int, depth: int, nodes: int, pv: List[Move],
+                 elapsed: float):
+        """
+        The outcome of a search (or of one completed iteration of it).
+
+        :param best_move: The move to play, or None if the side to move has no legal moves.
+        :param score: The score in centipawns from the side to move's point of view (see `mate_in`).
+        :param depth: The deepest fully completed iteration.
+        :param nodes: The number of nodes searched in total.
+        :param pv: The principal variation, starting with `best_move`.
+        :param elapsed: Wall-clock seconds spent searching.
+        """
+        self.best_move = best_move
+        self.score = score
+        self.depth = depth
+        self.nodes = nodes
+        self.pv = pv
+        self.elapsed = elapsed
+
+    @property
+    def nps(self) -> float:
+        """Nodes searched per second."""
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def mate_in(self) -> Optional[int]:
+        """Moves to mate if the score is a forced mate (negative when the side to move is being mated), else None."""
+        if abs(self.score) < MATE_THRESHOLD:
+            return None
+        plies = MATE_SCORE - abs(self.score)
+        moves = (plies + 1) // 2
+        return moves if self.score > 0 else -moves
+
+    def __repr__(self):
+        return (f"SearchResult(best_move={self.best_move}, score={self.score}, depth={self.depth}, "
+                f"nodes={self.nodes}, nps={self.nps:.0f})")
+
+
+class Engine:
+    def __init__(self, max_depth: int = MAX_DEPTH, time_limit: Optional[float] = None,
+                 node_limit: Optional[int] = None, hash_mb: float = 16):
+        """
+        :param max_depth: The deepest iteration to search, in plies.
+        :param time_limit: The default hard time budget per search, in seconds (None for no limit).
+        :param node_limit: The default hard node budget per search (None for no limit).
+        :param hash_mb: The memory for the transposition table, in megabytes. It is kept between searches.
+        """
+        self.max_depth = max_depth
+        self.transposition_table = TranspositionTable(hash_mb)
+        self.move_orderer = MoveOrderer(MAX_DEPTH)
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.stopped = False
+        self.nodes = 0
+        self.deadline: Optional[float] = None
+        self.max_nodes: Optional[int] = None
+        self.pv_table: List[List[Move]] = []
+        self.path_keys: List[int] = []
+
+    def stop(self) -> None:
+        """Asks a running search to return as soon as possible. Safe to call from another thread."""
+        self.stopped = True
+
+    def search(self, game: GameState, depth: Optional[int] = None, time_limit: Optional[float] = None,
+               node_limit: Optional[int] = None,
+               on_iteration: Optional[Callable[[SearchResult], None]] = None) -> SearchResult:
+        """
+        Searches `game` by iterative deepening and returns the result of the deepest completed iteration.
+
+        The search returns within its budget: when time or nodes run out part way through an iteration, that
+        iteration is abandoned and `game` is restored to the position it was called with.
+
+        :param depth: The deepest iteration to search (defaults to `max_depth`).
+        :param time_limit: Overrides the engine's default time budget, in seconds.
+        :param node_limit: Overrides the engine's default node budget.
+        :param on_iteration: Called with the result of each completed iteration.
+        """
+        start = time.perf_counter()
+        time_limit = self.time_limit if time_limit is None else time_limit
+        self.deadline = start + time_limit if time_limit is not None else None
+        self.max_nodes = self.node_limit if node_limit is None else node_limit
+        self.stopped = False
+        self.nodes = 0
+        self.pv_table = [[] for _ in range(MAX_DEPTH + 1)]
+        self.path_keys = []
+        self.transposition_table.new_search()
+        self.move_orderer.new_search()
+        root_history_length = len(game.history)
+
+        root_moves = game.get_all_valid_moves()
+        if not root_moves:
+            score = -MATE_SCORE if game.is_king_in_check(game.turn) else 0
+            return SearchResult(None, score, 0, 0, [], time.perf_counter() - start)
+
+        result = SearchResult(root_moves[0], 0, 0, 0, [root_moves[0]], 0.0)
+        pv: List[Move] = []
+        for iteration_depth in range(1, min(depth or self.max_depth, MAX_DEPTH) + 1):
+            try:
+                score = self.negamax(game, iteration_depth, -MATE_SCORE - 1, MATE_SCORE + 1, 0, pv)
+            except SearchAborted:
+                # Unwind the moves that were being searched when the budget ran out
+                while len(game.history) > root_history_length:
+                    game.unmake_move()
+                break
+            pv = list(self.pv_table[0])
+            result = SearchResult(pv[0] if pv else root_moves[0], score, iteration_depth, self.nodes, pv,
+                                  time.perf_counter() - start)
+            if on_iteration:
+                on_iteration(result)
+            # No point searching deeper once a forced mate has been found
+            if abs(score) >= MATE_THRESHOLD:
+                break
+
+        result.nodes = self.nodes
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    def check_budget(self) -> None:
+        """Raises SearchAborted if the search has been stopped or has used up its budget."""
+        if self.stopped:
+            raise SearchAborted()
+        if self.max_nodes is not None and self.nodes >= self.max_nodes:
+            raise SearchAborted()
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise SearchAborted()
+
+    def negamax(self, game: GameState, depth: int, alpha: int, beta: int, ply: int, pv: List[Move]) -> int:
+        """
+        Returns the score of `game` for the side to move, searched `depth` plies deep within the (alpha, beta)
+        window, and fills `pv_table[ply]` with the best line found.
+
+        :param pv: The principal variation of the previous iteration, whose moves are searched first.
+        """
+        self.nodes += 1
+        if self.nodes % BUDGET_CHECK_INTERVAL == 0 or (self.max_nodes is not None and self.nodes >= self.max_nodes):
+            self.check_budget()
+        self.pv_table[ply] = []
+
+        key = game.zobrist_key
+        # A repeated position within the search is scored as a draw
+        if ply > 0 and key in self.path_keys:
+            return 0
+
+        # A result stored from an earlier search of this position to at least this depth may settle it outright
+        entry = self.transposition_table.probe(key)
+        hash_move = 0
+        if entry:
+            entry_depth, bound, entry_score, hash_move = entry
+            if ply > 0 and entry_depth >= depth:
+                entry_score = score_from_table(entry_score, ply)
+                if (bound == EXACT or (bound == LOWER_BOUND and entry_score >= beta)
+                        or (bound == UPPER_BOUND and entry_score <= alpha)):
+                    return entry_score
+
+        if depth == 0 or ply >= MAX_DEPTH:
+            return self.quiescence(game, alpha, beta, ply)
+
+        moves = game.get_all_valid_moves()
+        if not moves:
+            return -MATE_SCORE + ply if game.is_king_in_check(game.turn) else 0
+
+        # Search the previous iteration's principal variation move first, or else the stored best move
+        child_pv = []
+        first_move = None
+        if ply < len(pv):
+            pv_code = move_code(pv[ply])
+            first_move = next((move for move in moves if move_code(move) == pv_code), None)
+            if first_move:
+                child_pv = pv
+        if hash_move and not first_move:
+            first_move = next((move for move in moves if move_code(move) == hash_move), None)
+        self.move_orderer.order(moves, ply, game.turn, first_move)
+
+        self.path_keys.append(key)
+        original_alpha = alpha
+        best_score = -MATE_SCORE - 1
+        best_move = moves[0]
+        for move in moves:
+            game.move_piece(move)
+            score = -self.negamax(game, depth - 1, -beta, -alpha, ply + 1, child_pv)
+            game.unmake_move()
+            # Only the first move can continue the previous principal variation
+            child_pv = []
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    self.pv_table[ply] = [move] + self.pv_table[ply + 1]
+                    if alpha >= beta:
+                        self.move_orderer.record_cutoff(move, depth, ply, game.turn)
+                        break
+        self.path_keys.pop()
+
+        if best_score >= beta:
+            bound = LOWER_BOUND
+        elif best_score > original_alpha:
+            bound = EXACT
+        else:
+            bound = UPPER_BOUND
+        self.transposition_table.store(key, depth, bound, score_to_table(best_score, ply), move_code(best_move))
+        return best_score
+
+    def quiescence(self, game: GameState, alpha: int, beta: int, ply: int) -> int:
+        """
+        Returns the score of `game` for the side to move once the captures and promotions have been played out.
+
+        The side to move may "stand pat" on the static evaluation instead of capturing, unless it is in check, in
+        which case every evasion is searched.
+        """
+        self.nodes += 1
+        if self.nodes % BUDGET_CHECK_INTERVAL == 0 or (self.max_nodes is not None and self.nodes >= self.max_nodes):
+            self.check_budget()
+        self.pv_table[ply] = []
+
+        in_check = game.in_check == game.turn
+        if ply >= MAX_DEPTH:
+            return self.evaluate(game)
+        if in_check:
+            moves = game.get_all_valid_moves()
+            if not moves:
+                return -MATE_SCORE + ply
+            best_score = -MATE_SCORE - 1
+        else:
+            best_score = self.evaluate(game)
+            if best_score >= beta:
+                return best_score
+            # Not even winning a queen would be enough
+            if best_score + PIECE_VALUES[PieceType.QUEEN] + DELTA_MARGIN < alpha:
+                return best_score
+            alpha = max(alpha, best_score)
+            moves = game.get_all_valid_moves(captures_only=True)
+        self.move_orderer.order(moves, ply, game.turn)
+
+        stand_pat = best_score
+        for move in moves:
+            if not in_check and not move.promotion:
+                gain = PIECE_VALUES[PieceType.PAWN] if move.en_passant else PIECE_VALUES[move.captured_piece.piece_type]
+                if stand_pat + gain + DELTA_MARGIN < alpha:
+                    continue
+            game.move_piece(move)
+            score = -self.quiescence(game, -beta, -alpha, ply + 1)
+            game.unmake_move()
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        return best_score
+
+    def evaluate(self, game: GameState) -> int:
+        """Returns the material balance in centipawns from the side to move's point of view."""
+        score = 0
+        for row in game.board:
+            for piece in row:
+                if piece:
+                    value = PIECE_VALUES[piece.piece_type]
+                    score += value if piece.colour == Colour.WHITE else -value
+        return score if game.turn == Colour.WHITE else -score
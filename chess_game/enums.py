@@ -28,3 +28,9 @@ class PieceType(Enum):
             "pawn": PieceType.PAWN
         }
         return map.get(name.lower())
+
+
+class Backend(Enum):
+    """The position representation used by `GameState` for move generation and check detection."""
+    MAILBOX = "mailbox"
+    BITBOARD = "bitboard"
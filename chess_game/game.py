@@ -1,12 +1,47 @@
-from chess_game.enums import Colour, PieceType
+from chess_game.bitboard import (Bitboards, COLOUR_INDEX, PIECE_INDEX, PAWN, KING, PAWN_ATTACKS, FULL_BOARD,
+                                 PROMOTION_RANKS, square, to_row_col, iter_squares)
+from chess_game.enums import Backend, Colour, PieceType
 from chess_game.move import Move
 from chess_game.pieces import Piece, Pawn, Bishop, Knight, Rook, Queen, King
+from chess_game import rules
+from chess_game.zobrist import PIECE_KEYS, hash_pieces, state_key
 from typing import Optional, List, Tuple
 
+PROMOTION_PIECES = (PieceType.QUEEN, PieceType.ROOK,
+                    PieceType.BISHOP, PieceType.KNIGHT)
+
+
+class BoardRow(list):
+    """
+    One row of `GameState.board`.
+
+    Assigning to a square directly (as when a position is set up by hand) marks the game's derived position
+    state, such as its bitboards, as stale so that it is rebuilt before the next query.
+    """
+    __slots__ = ("game",)
+
+    def __init__(self, game: 'GameState', squares: List[Optional[Piece]]):
+        super().__init__(squares)
+        self.game = game
+
+    def __setitem__(self, col, piece):
+        list.__setitem__(self, col, piece)
+        self.game.board_changed()
+
 
 class GameState:
-    def __init__(self):
-        self.board: List[List[Optional[Piece]]] = self.create_initial_board()
+    def __init__(self, backend: Backend = Backend.MAILBOX):
+        """
+        :param backend: The position representation used for move generation and check detection. The
+            `board` of Piece objects is kept up to date with either backend.
+        """
+        self.backend: Backend = backend
+        self.bitboards: Optional[Bitboards] = None
+        # The Zobrist key of the pieces on the board, updated square by square (see `zobrist_key`)
+        self.piece_hash: int = 0
+        self.board_stale: bool = True
+        self.board: List[List[Optional[Piece]]] = [
+            BoardRow(self, row) for row in self.create_initial_board()]
         self.turn: Colour = Colour.WHITE
         self.enpassant_square: Optional[Tuple[int, int]] = None
         self.in_check: Optional[Colour] = None
@@ -20,6 +55,8 @@ class GameState:
             Colour.BLACK: (0, 4),
         }
         self.history: List[Move] = []
+        # One compact record per move in `history`, used by `unmake_move` to restore the previous position
+        self.undo_stack: List[tuple] = []
 
     def create_initial_board(self) -> List[List[Optional[Piece]]]:
         """Initialises the board with Piece objects."""
@@ -61,68 +98,336 @@ class GameState:
         else:
             return ValueError(f"Unknown piece type: {piece_type}")
 
+    def board_changed(self) -> None:
+        """Marks the derived position state as stale after a direct edit of `board`."""
+        self.board_stale = True
+
+    def sync_board_state(self) -> None:
+        """Rebuilds the derived position state (king positions, bitboards and piece hash) if `board` was edited directly."""
+        if not self.board_stale:
+            return
+        self.king_positions = {Colour.WHITE: None, Colour.BLACK: None}
+        for row in range(8):
+            for col in range(8):
+                piece = self.board[row][col]
+                if piece and piece.piece_type == PieceType.KING:
+                    self.king_positions[piece.colour] = (row, col)
+        if self.backend == Backend.BITBOARD:
+            self.bitboards = Bitboards.from_board(self.board)
+        self.piece_hash = hash_pieces(self.board)
+        self.board_stale = False
+
+    @property
+    def zobrist_key(self) -> int:
+        """
+        The 64-bit Zobrist key of the position, covering the pieces, side to move, castling rights and en passant
+        square.
+
+        The piece part is updated incrementally as squares change; the rest is folded in from a few table lookups,
+        so reading the key is O(1) and stays correct when `turn` or the castling rights are assigned directly.
+        """
+        self.sync_board_state()
+        return self.piece_hash ^ state_key(self.turn, self.castling_rights, self.enpassant_square)
+
+    def set_square(self, row: int, col: int, piece: Optional[Piece]) -> None:
+        """Puts `piece` (or None) on a square, updating the derived position state incrementally."""
+        if not self.board_stale:
+            bitboards = self.bitboards
+            sq = square(row, col)
+            old_piece = self.board[row][col]
+            if old_piece:
+                colour, piece_index = COLOUR_INDEX[old_piece.colour], PIECE_INDEX[old_piece.piece_type]
+                self.piece_hash ^= PIECE_KEYS[colour][piece_index][sq]
+                if bitboards is not None:
+                    bitboards.remove(colour, piece_index, sq)
+            if piece:
+                colour, piece_index = COLOUR_INDEX[piece.colour], PIECE_INDEX[piece.piece_type]
+                self.piece_hash ^= PIECE_KEYS[colour][piece_index][sq]
+                if bitboards is not None:
+                    bitboards.add(colour, piece_index, sq)
+        list.__setitem__(self.board[row], col, piece)
+
     def is_active_piece(self, row: int, col: int) -> bool:
         """Returns True if the square contains a piece of the current player's colour."""
         return self.board[row][col] and self.board[row][col].colour == self.turn
 
     def get_valid_moves(self, row: int, col: int, simulate: bool = False) -> List[Move]:
-        """Returns a list of valid moves for a selected piece."""
+        """
+        Returns a list of valid moves for a selected piece.
+
+        :param simulate: If True, return the piece's moves without checking whether they leave its king in check.
+        """
         piece = self.board[row][col]
         if not piece or piece.colour != self.turn:
             return []
-        possible_moves: List[Move] = piece.get_valid_moves(self.board)
+        self.sync_board_state()
+        if self.backend == Backend.BITBOARD:
+            return self.get_bitboard_moves(piece, None if simulate else self.bitboards.checks_and_pins(COLOUR_INDEX[piece.colour]))
+        return self.get_mailbox_moves(piece, None if simulate else self.get_pins_and_check_mask(piece.colour))
+
+    def get_all_valid_moves(self, captures_only: bool = False) -> List[Move]:
+        """
+        Returns every valid move for the current player.
+
+        Unlike `get_valid_moves`, a pawn move to the last rank is returned once for each piece it can promote to.
+
+        :param captures_only: If True, only return captures (including en passant) and promotions.
+        """
+        self.sync_board_state()
+        if self.backend == Backend.BITBOARD:
+            get_moves = self.get_bitboard_moves
+            legality = self.bitboards.checks_and_pins(COLOUR_INDEX[self.turn])
+        else:
+            get_moves = self.get_mailbox_moves
+            legality = self.get_pins_and_check_mask(self.turn)
+
+        moves = []
+        for row in range(8):
+            for col in range(8):
+                piece = self.board[row][col]
+                if piece and piece.colour == self.turn:
+                    for move in get_moves(piece, legality, captures_only):
+                        if self.is_promotion_move(move):
+                            moves += [Move(move.from_row, move.from_col, move.to_row, move.to_col, move.piece_type,
+                                           captured_piece=move.captured_piece, promotion=promotion)
+                                      for promotion in PROMOTION_PIECES]
+                        else:
+                            moves.append(move)
+        return moves
+
+    def get_pins_and_check_mask(self, colour: Colour) -> Tuple[dict, Optional[set]]:
+        """
+        Works out which of the `colour` player's moves are legal without trying any of them on the board.
+
+        Returns the pinned pieces, each mapped to the set of squares on its pin line it may still move to, and the
+        check mask: None when the king is not in check, otherwise the set of squares a move by any other piece must
+        land on to capture the checking piece or block its line (empty in double check).
+        """
+        king_position = self.king_positions[colour]
+        if not king_position:
+            return {}, None
+        king_row, king_col = king_position
+        board = self.board
+        pins = {}
+        checks = []
+
+        # Walk out from the king along each line: an enemy slider is either giving check, or pinning the only
+        # friendly piece standing between it and the king
+        for directions, slider in ((rules.ORTHOGONAL_DIRECTIONS, PieceType.ROOK),
+                                   (rules.DIAGONAL_DIRECTIONS, PieceType.BISHOP)):
+            for dr, dc in directions:
+                line = []
+                pinned = None
+                r, c = king_row + dr, king_col + dc
+                while 0 <= r < 8 and 0 <= c < 8:
+                    line.append((r, c))
+                    piece = board[r][c]
+                    if piece:
+                        if piece.colour == colour:
+                            if pinned:
+                                break
+                            pinned = (r, c)
+                        else:
+                            if piece.piece_type == slider or piece.piece_type == PieceType.QUEEN:
+                                if pinned:
+                                    pins[pinned] = set(line)
+                                else:
+                                    checks.append(set(line))
+                            break
+                    r += dr
+                    c += dc
+
+        for dr, dc in rules.KNIGHT_OFFSETS:
+            r, c = king_row + dr, king_col + dc
+            if 0 <= r < 8 and 0 <= c < 8:
+                piece = board[r][c]
+                if piece and piece.colour != colour and piece.piece_type == PieceType.KNIGHT:
+                    checks.append({(r, c)})
+
+        # Enemy pawns attack the king from the row in front of it
+        r = king_row - 1 if colour == Colour.WHITE else king_row + 1
+        if 0 <= r < 8:
+            for c in (king_col - 1, king_col + 1):
+                if 0 <= c < 8:
+                    piece = board[r][c]
+                    if piece and piece.colour != colour and piece.piece_type == PieceType.PAWN:
+                        checks.append({(r, c)})
+
+        if not checks:
+            return pins, None
+        return pins, (checks[0] if len(checks) == 1 else set())
+
+    def get_mailbox_moves(self, piece: Piece, legality: Optional[Tuple[dict, Optional[set]]],
+                          captures_only: bool = False) -> List[Move]:
+        """
+        Returns the moves for `piece` using the mailbox board.
+
+        :param legality: The pins and check mask from `get_pins_and_check_mask`, or None to skip the check test.
+        :param captures_only: If True, only return captures and promotions.
+        """
+        possible_moves: List[Move] = piece.get_valid_moves(self.board, captures_only)
         # Add en passant move if applicable
         if isinstance(piece, Pawn) and self.enpassant_square:
             piece.add_enpassant(
                 self.board, self.enpassant_square, possible_moves)
 
         # Add castling move(s) if applicable
-        if isinstance(piece, King) and (self.castling_rights[self.turn]['kingside'] or self.castling_rights[self.turn]['queenside']):
+        if not captures_only and isinstance(piece, King) and (self.castling_rights[piece.colour]['kingside'] or self.castling_rights[piece.colour]['queenside']):
             piece.add_castling(
-                self.board, self.castling_rights[self.turn], possible_moves)
+                self.board, self.castling_rights[piece.colour], possible_moves)
 
-        if simulate:
+        if legality is None:
             return possible_moves
 
+        row, col = piece.row, piece.col
+        opponent = Colour.BLACK if piece.colour == Colour.WHITE else Colour.WHITE
+        board = self.board
+        if isinstance(piece, King):
+            # Lift the king off the board so that a slider checking it also covers the squares behind it
+            list.__setitem__(board[row], col, None)
+            moves = [move for move in possible_moves
+                     if not rules.is_square_attacked(board, (move.to_row, move.to_col), opponent)]
+            list.__setitem__(board[row], col, piece)
+            return moves
+
+        pins, check_mask = legality
+        pin_line = pins.get((row, col))
         moves = []
-        # Only allow moves that do not put the current player in check
         for move in possible_moves:
-            new_row, new_col = move.to_row, move.to_col
-            # Simulate the move
-            # Store whatever was in the destination
-            original_piece = self.board[new_row][new_col]
-            self.board[new_row][new_col] = piece
-            self.board[row][col] = None
-            piece.set_position(new_row, new_col)
-            self.swap_turn()
+            if move.en_passant:
+                if not self.enpassant_exposes_king(move, piece.colour):
+                    moves.append(move)
+                continue
+            target = (move.to_row, move.to_col)
+            # A pinned piece may only move along its pin line, and in check a move must capture or block the checker
+            if pin_line is not None and target not in pin_line:
+                continue
+            if check_mask is not None and target not in check_mask:
+                continue
+            moves.append(move)
+        return moves
 
-            if not self.is_king_in_check(piece.colour):
-                moves.append(move)
+    def enpassant_exposes_king(self, move: Move, colour: Colour) -> bool:
+        """
+        Returns whether an en passant capture would leave the `colour` king in check.
 
-            # Undo the move
-            self.board[row][col] = piece
-            self.board[new_row][new_col] = original_piece
-            piece.set_position(row, col)
-            self.swap_turn()
+        En passant is the one move that empties two squares at once (so it can uncover an attack along the rank
+        that no pin covers), so the pawns are briefly moved on the board rather than using the pin and check masks.
+        """
+        king_position = self.king_positions[colour]
+        if not king_position:
+            return False
+        board = self.board
+        pawn = board[move.from_row][move.from_col]
+        captured = board[move.from_row][move.to_col]
+        list.__setitem__(board[move.from_row], move.from_col, None)
+        list.__setitem__(board[move.from_row], move.to_col, None)
+        list.__setitem__(board[move.to_row], move.to_col, pawn)
+        opponent = Colour.BLACK if colour == Colour.WHITE else Colour.WHITE
+        exposed = rules.is_square_attacked(board, king_position, opponent)
+        list.__setitem__(board[move.to_row], move.to_col, None)
+        list.__setitem__(board[move.from_row], move.to_col, captured)
+        list.__setitem__(board[move.from_row], move.from_col, pawn)
+        return exposed
+
+    def get_bitboard_moves(self, piece: Piece, legality: Optional[Tuple[int, dict]],
+                           captures_only: bool = False) -> List[Move]:
+        """
+        Returns the moves for `piece` using the bitboard backend.
+
+        :param legality: The check mask and pins from `Bitboards.checks_and_pins`, or None to skip the check test.
+        :param captures_only: If True, only return captures and promotions.
+        """
+        bitboards = self.bitboards
+        colour = COLOUR_INDEX[piece.colour]
+        piece_index = PIECE_INDEX[piece.piece_type]
+        row, col = piece.row, piece.col
+        from_sq = square(row, col)
+        targets = bitboards.pseudo_legal_targets(piece_index, colour, from_sq)
+        if captures_only:
+            targets &= bitboards.occupancy[colour ^ 1] | (PROMOTION_RANKS if piece_index == PAWN else 0)
+        if legality is not None:
+            if piece_index == KING:
+                # Squares are tested with the king lifted, so that a slider checking it covers the squares behind it
+                occupied = bitboards.occupied & ~(1 << from_sq)
+                targets = sum(1 << to_sq for to_sq in iter_squares(targets)
+                              if not bitboards.is_square_attacked(to_sq, colour ^ 1, occupied))
+            else:
+                check_mask, pins = legality
+                targets &= check_mask & pins.get(from_sq, FULL_BOARD)
+
+        moves = []
+        for to_sq in iter_squares(targets):
+            to_row, to_col = to_row_col(to_sq)
+            moves.append(Move(row, col, to_row, to_col, piece.piece_type,
+                              captured_piece=self.board[to_row][to_col]))
+
+        # Add en passant move if applicable. Taking the pawn beside this one can uncover an attack that the pins
+        # do not cover, so the resulting position is tested directly.
+        if piece_index == PAWN and self.enpassant_square:
+            ep_row, ep_col = self.enpassant_square
+            ep_sq = square(ep_row, ep_col)
+            if PAWN_ATTACKS[colour][from_sq] & (1 << ep_sq):
+                if legality is None or bitboards.leaves_king_safe(from_sq, ep_sq, colour, square(row, ep_col)):
+                    moves.append(Move(row, col, ep_row, ep_col, piece.piece_type,
+                                      captured_piece=self.board[ep_row][ep_col], en_passant=True))
+
+        # Add castling move(s) if applicable
+        if piece_index == KING and legality is not None and not captures_only:
+            self.add_bitboard_castling(piece, moves)
 
         return moves
 
-    def move_piece(self, move: Move) -> None:
+    def add_bitboard_castling(self, king: King, moves: List[Move]) -> None:
+        """Adds the castling moves available to `king`, using the bitboard backend for attack detection."""
+        rights = self.castling_rights[king.colour]
+        home_row = 7 if king.colour == Colour.WHITE else 0
+        if king.row != home_row or king.col != 4 or not (rights['kingside'] or rights['queenside']):
+            return
+        bitboards = self.bitboards
+        colour = COLOUR_INDEX[king.colour]
+        opponent = colour ^ 1
+        king_sq = square(home_row, 4)
+        occupied = bitboards.occupied
+        if bitboards.is_square_attacked(king_sq, opponent):
+            return
+        own_rooks = bitboards.pieces[colour][PIECE_INDEX[PieceType.ROOK]]
+        for side, rook_col, between, to_col, through_col in (('kingside', 7, (5, 6), 6, 5),
+                                                             ('queenside', 0, (1, 2, 3), 2, 3)):
+            if not rights[side] or not own_rooks & (1 << square(home_row, rook_col)):
+                continue
+            if any(occupied & (1 << square(home_row, c)) for c in between):
+                continue
+            if bitboards.is_square_attacked(square(home_row, through_col), opponent):
+                continue
+            if not bitboards.is_square_attacked(square(home_row, to_col), opponent, occupied & ~(1 << king_sq)):
+                moves.append(Move(home_row, 4, home_row, to_col,
+                                  PieceType.KING, castling=side))
+
+    def move_piece(self, move: Move) -> bool:
+        """Makes `move` for the current player. Returns False, changing nothing, if there is no piece of theirs to move."""
         piece = self.board[move.from_row][move.from_col]
         if piece and piece.colour == self.turn:
+            self.sync_board_state()
+            # Record what is needed to take the move back
+            captured_row, captured_col = (move.from_row, move.to_col) if move.en_passant else (move.to_row, move.to_col)
+            self.undo_stack.append((
+                piece, self.board[captured_row][captured_col], self.enpassant_square, self.get_castling_state(),
+                self.in_check, self.is_checkmate, self.king_positions[self.turn]))
+
             # Move piece to new position
             if move.promotion:
                 new_piece = self.create_piece(
                     self.turn, move.promotion, move.to_row, move.to_col)
-                self.board[move.to_row][move.to_col] = new_piece
+                self.set_square(move.to_row, move.to_col, new_piece)
             else:
-                self.board[move.to_row][move.to_col] = piece
+                self.set_square(move.to_row, move.to_col, piece)
                 piece.set_position(move.to_row, move.to_col)
-            self.board[move.from_row][move.from_col] = None
+            self.set_square(move.from_row, move.from_col, None)
 
             # Remove taken pawn when move is en-passant take
             if move.en_passant:
-                self.board[move.from_row][move.to_col] = None
+                self.set_square(move.from_row, move.to_col, None)
 
             # Update the en-passant square
             self.update_enpassant_square(move)
@@ -131,8 +436,10 @@ class GameState:
             self.update_castling_rights(move)
 
             # Move Rook if the move is a castle
-            if move.piece_type == PieceType.KING and move.castling:
-                self.move_castled_rook(move)
+            if move.piece_type == PieceType.KING:
+                self.king_positions[self.turn] = (move.to_row, move.to_col)
+                if move.castling:
+                    self.move_castled_rook(move)
 
             # Is opponent in check?
             opponent = Colour.BLACK if self.turn == Colour.WHITE else Colour.WHITE
@@ -149,6 +456,54 @@ class GameState:
                 self.is_checkmate = True
 
             self.history.append(move)
+            return True
+        return False
+
+    def unmake_move(self) -> Optional[Move]:
+        """
+        Takes back the last move made with `move_piece`, restoring the board, castling rights, en passant square,
+        check flags, king positions and any captured piece. Returns the move taken back, or None if there is none.
+        """
+        if not self.undo_stack:
+            return None
+        move = self.history.pop()
+        piece, captured_piece, enpassant_square, castling_state, in_check, is_checkmate, king_position = \
+            self.undo_stack.pop()
+        self.swap_turn()
+
+        # Put the castled rook back in its corner
+        if move.piece_type == PieceType.KING and move.castling:
+            rook_col, castled_col = (7, 5) if move.castling == 'kingside' else (0, 3)
+            rook = self.board[move.from_row][castled_col]
+            self.set_square(move.from_row, castled_col, None)
+            self.set_square(move.from_row, rook_col, rook)
+            rook.set_position(move.from_row, rook_col)
+
+        # Move the piece back (the original pawn replaces a promoted piece) and restore any captured piece
+        self.set_square(move.to_row, move.to_col, None)
+        self.set_square(move.from_row, move.from_col, piece)
+        piece.set_position(move.from_row, move.from_col)
+        if captured_piece:
+            self.set_square(captured_piece.row, captured_piece.col, captured_piece)
+
+        self.enpassant_square = enpassant_square
+        self.set_castling_state(castling_state)
+        self.in_check = in_check
+        self.is_checkmate = is_checkmate
+        self.king_positions[self.turn] = king_position
+        return move
+
+    def get_castling_state(self) -> Tuple[bool, bool, bool, bool]:
+        """Returns the castling rights as a (white kingside, white queenside, black kingside, black queenside) tuple."""
+        white = self.castling_rights[Colour.WHITE]
+        black = self.castling_rights[Colour.BLACK]
+        return white['kingside'], white['queenside'], black['kingside'], black['queenside']
+
+    def set_castling_state(self, state: Tuple[bool, bool, bool, bool]) -> None:
+        """Restores castling rights saved with `get_castling_state`."""
+        white = self.castling_rights[Colour.WHITE]
+        black = self.castling_rights[Colour.BLACK]
+        white['kingside'], white['queenside'], black['kingside'], black['queenside'] = state
 
     def swap_turn(self) -> None:
         """Swaps the current player turn after a move is made."""
@@ -156,28 +511,26 @@ class GameState:
 
     def is_king_in_check(self, colour: Colour) -> bool:
         """Returns whether the `colour` player is currently in check."""
-        king_position = None
-
-        # Find the king on the board
-        for row in range(8):
-            for col in range(8):
-                piece = self.board[row][col]
-                if piece and isinstance(piece, King) and piece.colour == colour:
-                    king_position = (row, col)
-                    break
-
+        self.sync_board_state()
+        if self.backend == Backend.BITBOARD:
+            colour_index = COLOUR_INDEX[colour]
+            king_sq = self.bitboards.king_square(colour_index)
+            if king_sq is None:
+                raise ValueError("There is no position found for the king")
+            return self.bitboards.is_square_attacked(king_sq, colour_index ^ 1)
+
+        king_position = self.king_positions[colour]
         if not king_position:
             raise ValueError("There is no position found for the king")
-
-        # See if any opponent piece can attack the king's position
         opponent_colour = Colour.BLACK if colour == Colour.WHITE else Colour.WHITE
-        for row in range(8):
-            for col in range(8):
-                piece = self.board[row][col]
-                if piece and piece.colour == opponent_colour:
-                    if Move.contains_move(self.get_valid_moves(row, col, simulate=True), king_position[0], king_position[1]):
-                        return True
-        return False
+        return rules.is_square_attacked(self.board, king_position, opponent_colour)
+
+    def is_square_attacked(self, square: Tuple[int, int], by_colour: Colour) -> bool:
+        """Returns whether any `by_colour` piece attacks `square`, a (row, col) tuple."""
+        self.sync_board_state()
+        if self.backend == Backend.BITBOARD:
+            return self.bitboards.is_square_attacked(square[0] * 8 + square[1], COLOUR_INDEX[by_colour])
+        return rules.is_square_attacked(self.board, square, by_colour)
 
     def is_checkmate_position(self, colour: Colour) -> bool:
         """Returns True if the given color is in checkmate, False otherwise."""
@@ -216,42 +569,51 @@ class GameState:
             self.castling_rights[self.turn]['queenside'] = False
         # If the rook moves...
         elif move.piece_type == PieceType.ROOK:
+            home_row = 7 if self.turn == Colour.WHITE else 0
             # If castling is currently allowed, but the kingside rook has moved
-            if self.castling_rights[self.turn]['kingside'] and move.from_col == 7:
+            if self.castling_rights[self.turn]['kingside'] and move.from_row == home_row and move.from_col == 7:
                 # Deny right to castle kingside
                 self.castling_rights[self.turn]['kingside'] = False
             # If castling is currently allowed, but the queenside rook has moved
-            elif self.castling_rights[self.turn]['queenside'] and move.from_col == 0:
+            elif self.castling_rights[self.turn]['queenside'] and move.from_row == home_row and move.from_col == 0:
                 # Deny right to castle queenside
                 self.castling_rights[self.turn]['queenside'] = False
 
+        # If a rook is captured on its starting square, the opponent can no longer castle on that side
+        opponent = Colour.BLACK if self.turn == Colour.WHITE else Colour.WHITE
+        if move.to_row == (7 if opponent == Colour.WHITE else 0):
+            if move.to_col == 7:
+                self.castling_rights[opponent]['kingside'] = False
+            elif move.to_col == 0:
+                self.castling_rights[opponent]['queenside'] = False
+
     def move_castled_rook(self, move: Move):
         # We know this is a King move already, and that it is a castling move.
         if move.castling == 'kingside':
             # Kingside white
             if self.turn == Colour.WHITE:
                 rook = self.board[7][7]
-                self.board[7][7] = None
-                self.board[7][5] = rook
+                self.set_square(7, 7, None)
+                self.set_square(7, 5, rook)
                 rook.set_position(7, 5)
             # Kingside black
             else:
                 rook = self.board[0][7]
-                self.board[0][7] = None
-                self.board[0][5] = rook
+                self.set_square(0, 7, None)
+                self.set_square(0, 5, rook)
                 rook.set_position(0, 5)
         else:
             # Queenside white
             if self.turn == Colour.WHITE:
                 rook = self.board[7][0]
-                self.board[7][0] = None
-                self.board[7][3] = rook
+                self.set_square(7, 0, None)
+                self.set_square(7, 3, rook)
                 rook.set_position(7, 3)
             # Kingside black
             else:
                 rook = self.board[0][0]
-                self.board[0][0] = None
-                self.board[0][3] = rook
+                self.set_square(0, 0, None)
+                self.set_square(0, 3, rook)
                 rook.set_position(0, 3)
 
     def print_board(self) -> None:
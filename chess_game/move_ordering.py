@@ -0,0 +1,111 @@
+"""
+Move ordering for the search engine: alpha-beta prunes most when the best move is searched first.
+
+Moves are tried in this order: the principal variation or transposition table move, winning-first captures and
+promotions by MVV-LVA (most valuable victim, least valuable attacker), the killer moves for the ply, and then quiet
+moves by their history score.
+"""
+from chess_game.enums import Colour, PieceType
+from chess_game.move import Move
+from typing import List, Optional
+
+# Piece ranks used for MVV-LVA: the victim's rank dominates, and the attacker's breaks ties
+ORDER_VALUES = {
+    PieceType.PAWN: 1,
+    PieceType.KNIGHT: 2,
+    PieceType.BISHOP: 3,
+    PieceType.ROOK: 4,
+    PieceType.QUEEN: 5,
+    PieceType.KING: 6
+}
+
+HASH_MOVE_SCORE = 1 << 30
+CAPTURE_SCORE = 1 << 26
+FIRST_KILLER_SCORE = CAPTURE_SCORE - 1
+SECOND_KILLER_SCORE = CAPTURE_SCORE - 2
+# History scores are kept below the killer scores
+HISTORY_LIMIT = 1 << 24
+
+
+def move_squares(move: Move) -> int:
+    """Returns the from and to squares of a move as a single index in 0..4095."""
+    return (move.from_row * 8 + move.from_col) * 64 + move.to_row * 8 + move.to_col
+
+
+def is_quiet(move: Move) -> bool:
+    """Returns whether a move is neither a capture nor a promotion."""
+    return not move.captured_piece and not move.en_passant and not move.promotion
+
+
+def mvv_lva_score(move: Move) -> int:
+    """Returns the MVV-LVA score of a capture or promotion."""
+    victim = PieceType.PAWN if move.en_passant else (move.captured_piece.piece_type if move.captured_piece else None)
+    score = ORDER_VALUES[victim] * 8 - ORDER_VALUES[move.piece_type] if victim else 0
+    if move.promotion:
+        score += ORDER_VALUES[move.promotion] * 8
+    return CAPTURE_SCORE + score
+
+
+class MoveOrderer:
+    def __init__(self, max_ply: int = 64):
+        """
+        Keeps the killer moves and history table that the search updates as it goes.
+
+        :param max_ply: The deepest ply killer moves are kept for.
+        """
+        self.max_ply = max_ply
+        # killers[ply]: the from/to squares (as `move_squares`) of the last two quiet moves that caused a cutoff
+        self.killers: List[List[int]] = [[-1, -1] for _ in range(max_ply + 1)]
+        # history[colour][from * 64 + to]: how often, weighted by depth, a quiet move caused a beta cutoff
+        self.history = {Colour.WHITE: [0] * 4096, Colour.BLACK: [0] * 4096}
+
+    def new_search(self) -> None:
+        """Forgets the killer moves and ages the history scores, ready for a new search."""
+        self.killers = [[-1, -1] for _ in range(self.max_ply + 1)]
+        for table in self.history.values():
+            for index, value in enumerate(table):
+                if value:
+                    table[index] = value >> 1
+
+    def order(self, moves: List[Move], ply: int, colour: Colour, first_move: Optional[Move] = None) -> List[Move]:
+        """
+        Sorts `moves` in place into the order they should be searched, and returns them.
+
+        :param first_move: A move to search before all others, such as the principal variation or hash move.
+        """
+        first_squares = move_squares(first_move) if first_move else -1
+        first_promotion = first_move.promotion if first_move else None
+        first_killer, second_killer = self.killers[ply] if ply <= self.max_ply else (-1, -1)
+        history = self.history[colour]
+
+        def score(move: Move) -> int:
+            squares = move_squares(move)
+            if squares == first_squares and move.promotion == first_promotion:
+                return HASH_MOVE_SCORE
+            if move.captured_piece or move.en_passant or move.promotion:
+                return mvv_lva_score(move)
+            if squares == first_killer:
+                return FIRST_KILLER_SCORE
+            if squares == second_killer:
+                return SECOND_KILLER_SCORE
+            return history[squares]
+
+        moves.sort(key=score, reverse=True)
+        return moves
+
+    def record_cutoff(self, move: Move, depth: int, ply: int, colour: Colour) -> None:
+        """Records that a quiet `move` caused a beta cutoff at `ply`, `depth` plies from the horizon."""
+        if not is_quiet(move):
+            return
+        squares = move_squares(move)
+        if ply <= self.max_ply:
+            killers = self.killers[ply]
+            if squares != killers[0]:
+                killers[1] = killers[0]
+                killers[0] = squares
+        history = self.history[colour]
+        history[squares] += depth * depth
+        if history[squares] >= HISTORY_LIMIT:
+            # Keep the relative order while staying below the killer scores
+            for index, value in enumerate(history):
+                history[index] = value >> 1
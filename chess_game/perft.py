@@ -0,0 +1,133 @@
+"""
+Perft: counts the leaf nodes of the legal move tree to a fixed depth.
+
+Run `python -m chess_game.perft` to validate move generation against the published node counts of a set of
+standard positions, and to measure its throughput.
+"""
+from chess_game.enums import Backend, Colour, PieceType
+from chess_game.game import GameState
+from chess_game.move import Move
+from chess_game.pieces import Pawn, Knight, Bishop, Rook, Queen, King
+from typing import Dict, List, Optional
+import argparse
+import time
+
+# Standard perft positions (https://www.chessprogramming.org/Perft_Results) with their known node counts by depth
+STANDARD_POSITIONS = {
+    "initial": ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+                [20, 400, 8902, 197281]),
+    "kiwipete": ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+                 [48, 2039, 97862, 4085603]),
+    "position3": ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+                  [14, 191, 2812, 43238]),
+    "position4": ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+                  [6, 264, 9467, 422333]),
+    "position5": ("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+                  [44, 1486, 62379, 2103487]),
+}
+
+_FEN_PIECES = {"p": Pawn, "n": Knight, "b": Bishop, "r": Rook, "q": Queen, "k": King}
+
+
+def _load_fen(fen: str, backend: Backend = Backend.MAILBOX) -> GameState:
+    """Builds a GameState from the board, turn, castling and en passant fields of a FEN string."""
+    placement, turn, castling, enpassant = fen.split()[:4]
+    game = GameState(backend)
+    for row, rank in enumerate(placement.split("/")):
+        col = 0
+        for char in rank:
+            if char.isdigit():
+                for _ in range(int(char)):
+                    game.board[row][col] = None
+                    col += 1
+                continue
+            colour = Colour.WHITE if char.isupper() else Colour.BLACK
+            piece = _FEN_PIECES[char.lower()](colour, row, col)
+            game.board[row][col] = piece
+            col += 1
+
+    game.turn = Colour.WHITE if turn == "w" else Colour.BLACK
+    game.castling_rights[Colour.WHITE]["kingside"] = "K" in castling
+    game.castling_rights[Colour.WHITE]["queenside"] = "Q" in castling
+    game.castling_rights[Colour.BLACK]["kingside"] = "k" in castling
+    game.castling_rights[Colour.BLACK]["queenside"] = "q" in castling
+    if enpassant != "-":
+        game.enpassant_square = (8 - int(enpassant[1]), ord(enpassant[0]) - ord("a"))
+    game.in_check = game.turn if game.is_king_in_check(game.turn) else None
+    return game
+
+
+def move_to_uci(move: Move) -> str:
+    """Returns the move in coordinate notation, e.g. 'e2e4' or 'e7e8q'."""
+    text = (f"{chr(ord('a') + move.from_col)}{8 - move.from_row}"
+            f"{chr(ord('a') + move.to_col)}{8 - move.to_row}")
+    if move.promotion:
+        text += "n" if move.promotion == PieceType.KNIGHT else move.promotion.value[0]
+    return text
+
+
+def perft(game: GameState, depth: int) -> int:
+    """Returns the number of leaf nodes of the legal move tree `depth` plies below `game`."""
+    if depth == 0:
+        return 1
+    moves = game.get_all_valid_moves()
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        game.move_piece(move)
+        nodes += perft(game, depth - 1)
+        game.unmake_move()
+    return nodes
+
+
+def divide(game: GameState, depth: int) -> Dict[str, int]:
+    """Returns the perft node count below each legal root move, keyed by the move in coordinate notation."""
+    counts = {}
+    for move in game.get_all_valid_moves():
+        game.move_piece(move)
+        counts[move_to_uci(move)] = perft(game, depth - 1)
+        game.unmake_move()
+    return counts
+
+
+def run_position(name: str, depth: int, backend: Backend = Backend.MAILBOX, show_divide: bool = False) -> bool:
+    """Runs perft on one of the standard positions, prints the result and returns whether it matched."""
+    fen, expected_counts = STANDARD_POSITIONS[name]
+    game = _load_fen(fen, backend)
+    start = time.perf_counter()
+    if show_divide:
+        counts = divide(game, depth)
+        nodes = sum(counts.values())
+    else:
+        nodes = perft(game, depth)
+    elapsed = time.perf_counter() - start
+
+    expected: Optional[int] = expected_counts[depth - 1] if depth <= len(expected_counts) else None
+    status = "?" if expected is None else ("ok" if nodes == expected else f"MISMATCH (expected {expected})")
+    nps = nodes / elapsed if elapsed > 0 else float("inf")
+    print(f"{name:<10} depth {depth}  nodes {nodes:>10}  time {elapsed:8.3f}s  nps {nps:>10.0f}  {status}")
+    if show_divide:
+        for move, count in sorted(counts.items()):
+            print(f"    {move}: {count}")
+    return expected is None or nodes == expected
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Perft move generation benchmark and validation.")
+    parser.add_argument("-d", "--depth", type=int, default=3, help="search depth in plies (default: 3)")
+    parser.add_argument("-p", "--position", choices=sorted(STANDARD_POSITIONS), action="append",
+                        help="position(s) to run (default: all)")
+    parser.add_argument("-b", "--backend", choices=[b.value for b in Backend], default=Backend.MAILBOX.value,
+                        help="GameState backend (default: mailbox)")
+    parser.add_argument("--divide", action="store_true", help="print the node count below each root move")
+    args = parser.parse_args(argv)
+
+    backend = Backend(args.backend)
+    results = [run_position(name, args.depth, backend, args.divide)
+               for name in (args.position or STANDARD_POSITIONS)]
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,7 @@
 from PyQt6.QtGui import QPixmap
 from chess_game.enums import Colour, PieceType
 from chess_game.move import Move
+from chess_game.rules import is_square_attacked
 from typing import Optional, List, Tuple
 
 
@@ -42,18 +43,23 @@ class Pawn(Piece):
     def __init__(self, colour: Colour, row: int, col: int):
         super().__init__(colour, PieceType.PAWN, row, col)
 
-    def get_valid_moves(self, board: List[List[Optional[Piece]]]) -> List[Move]:
+    def get_valid_moves(self, board: List[List[Optional[Piece]]], captures_only: bool = False) -> List[Move]:
+        """
+        Returns the pawn's moves, not considering checks or en passant.
+
+        :param captures_only: If True, only return captures and pushes to the last rank (promotions).
+        """
         moves = []
         # White moves up, black moves down
         direction = -1 if self.colour == Colour.WHITE else 1
 
         # Regular 1-square move
-        if board[self.row + direction][self.col] is None:
+        if board[self.row + direction][self.col] is None and (not captures_only or self.row + direction in (0, 7)):
             moves.append(Move(self.row, self.col, self.row +
                          direction, self.col, self.piece_type))
 
         # Initial 2-square move
-        if (self.colour == Colour.WHITE and self.row == 6) or (self.colour == Colour.BLACK and self.row == 1):
+        if not captures_only and ((self.colour == Colour.WHITE and self.row == 6) or (self.colour == Colour.BLACK and self.row == 1)):
             if board[self.row + (2 * direction)][self.col] is None and board[self.row + direction][self.col] is None:
                 moves.append(Move(self.row, self.col, self.row +
                              (2 * direction), self.col, self.piece_type))
@@ -88,7 +94,12 @@ class Bishop(Piece):
     def __init__(self, colour: Colour, row: int, col: int):
         super().__init__(colour, PieceType.BISHOP, row, col)
 
-    def get_valid_moves(self, board: List[List[Optional[Piece]]]) -> List[Move]:
+    def get_valid_moves(self, board: List[List[Optional[Piece]]], captures_only: bool = False) -> List[Move]:
+        """
+        Returns the piece's moves, not considering checks.
+
+        :param captures_only: If True, only return captures.
+        """
         moves = []
         # Diagonal movement
         directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
@@ -101,8 +112,9 @@ class Bishop(Piece):
                     break  # Out of bounds
                 # Move to an empty square
                 if board[r][c] is None:
-                    moves.append(
-                        Move(self.row, self.col, r, c, self.piece_type))
+                    if not captures_only:
+                        moves.append(
+                            Move(self.row, self.col, r, c, self.piece_type))
                 # Capture enemy piece
                 elif board[r][c].colour != self.colour:
                     moves.append(Move(self.row, self.col, r, c,
@@ -119,7 +131,12 @@ class Knight(Piece):
     def __init__(self, colour: Colour, row: int, col: int):
         super().__init__(colour, PieceType.KNIGHT, row, col)
 
-    def get_valid_moves(self, board: List[List[Optional[Piece]]]) -> List[Move]:
+    def get_valid_moves(self, board: List[List[Optional[Piece]]], captures_only: bool = False) -> List[Move]:
+        """
+        Returns the piece's moves, not considering checks.
+
+        :param captures_only: If True, only return captures.
+        """
         moves = []
         translations = [(-2, -1), (-2, 1), (-1, -2), (-1, 2),
                         (1, -2), (1, 2), (2, -1), (2, 1)]
@@ -131,7 +148,8 @@ class Knight(Piece):
                 continue  # Out of bounds
             # Move to an empty square
             if board[r][c] is None:
-                moves.append(Move(self.row, self.col, r, c, self.piece_type))
+                if not captures_only:
+                    moves.append(Move(self.row, self.col, r, c, self.piece_type))
             # Capture enemy piece
             elif board[r][c].colour != self.colour:
                 moves.append(Move(self.row, self.col, r, c,
@@ -146,7 +164,12 @@ class Rook(Piece):
     def __init__(self, colour: Colour, row: int, col: int):
         super().__init__(colour, PieceType.ROOK, row, col)
 
-    def get_valid_moves(self, board: List[List[Optional[Piece]]]) -> List[Move]:
+    def get_valid_moves(self, board: List[List[Optional[Piece]]], captures_only: bool = False) -> List[Move]:
+        """
+        Returns the piece's moves, not considering checks.
+
+        :param captures_only: If True, only return captures.
+        """
         moves = []
         # Vertical and horizontal movement
         directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
@@ -159,8 +182,9 @@ class Rook(Piece):
                     break  # Out of bounds
                 # Move to an empty square
                 if board[r][c] is None:
-                    moves.append(
-                        Move(self.row, self.col, r, c, self.piece_type))
+                    if not captures_only:
+                        moves.append(
+                            Move(self.row, self.col, r, c, self.piece_type))
                 # Capture enemy piece
                 elif board[r][c].colour != self.colour:
                     moves.append(Move(self.row, self.col, r, c,
@@ -177,13 +201,18 @@ class Queen(Piece):
     def __init__(self, colour: Colour, row: int, col: int):
         super().__init__(colour, PieceType.QUEEN, row, col)
 
-    def get_valid_moves(self, board: List[List[Optional[Piece]]]) -> List[Move]:
+    def get_valid_moves(self, board: List[List[Optional[Piece]]], captures_only: bool = False) -> List[Move]:
+        """
+        Returns the queen's moves, not considering checks.
+
+        :param captures_only: If True, only return captures.
+        """
         rook_moves = Rook(self.colour, self.row,
-                          self.col).get_valid_moves(board)
+                          self.col).get_valid_moves(board, captures_only)
         for move in rook_moves:
             move.piece_type = PieceType.QUEEN
         bishop_moves = Bishop(self.colour, self.row,
-                              self.col).get_valid_moves(board)
+                              self.col).get_valid_moves(board, captures_only)
         for move in bishop_moves:
             move.piece_type = PieceType.QUEEN
         return rook_moves + bishop_moves
@@ -193,7 +222,12 @@ class King(Piece):
     def __init__(self, colour: Colour, row: int, col: int):
         super().__init__(colour, PieceType.KING, row, col)
 
-    def get_valid_moves(self, board: List[List[Optional[Piece]]]) -> List[Move]:
+    def get_valid_moves(self, board: List[List[Optional[Piece]]], captures_only: bool = False) -> List[Move]:
+        """
+        Returns the piece's moves, not considering checks.
+
+        :param captures_only: If True, only return captures.
+        """
         moves = []
         translations = [(-1, -1), (-1, 0), (-1, 1), (0, -1),
                         (0, 1), (1, -1), (1, 0), (1, 1)]
@@ -205,7 +239,8 @@ class King(Piece):
                 continue  # Out of bounds
             # Move to an empty square
             if board[r][c] is None:
-                moves.append(Move(self.row, self.col, r, c, self.piece_type))
+                if not captures_only:
+                    moves.append(Move(self.row, self.col, r, c, self.piece_type))
             # Capture enemy piece
             elif board[r][c].colour != self.colour:
                 moves.append(Move(self.row, self.col, r, c,
@@ -228,34 +263,17 @@ class King(Piece):
         possible_moves = []
         if castling_rights['kingside']:
             # Check that the pieces between the king and rook have moved
-            # TODO: Check if the piece moved through check
             if board[row][5] is None and board[row][6] is None and self.row == row and self.col == 4 and board[row][7] and board[row][7].piece_type == PieceType.ROOK:
-                possible_moves.append(Move(self.row, self.col, row, 6,
-                                           self.piece_type, castling='kingside'))
-                through_square = (self.row, 5)
+                possible_moves.append((Move(self.row, self.col, row, 6,
+                                            self.piece_type, castling='kingside'), (self.row, 5)))
         if castling_rights['queenside']:
             # Check the pieces between the king and rook have moved
-            # TODO: Check if the piece moved through check
             if board[row][3] is None and board[row][2] is None and board[row][1] is None and self.row == row and self.col == 4 and board[row][0] and board[row][0].piece_type == PieceType.ROOK:
-                possible_moves.append(Move(self.row, self.col, row, 2,
-                                           self.piece_type, castling='queenside'))
-                through_square = (self.row, 3)
-
-        for move in possible_moves:
-            try:
-                for row in range(8):
-                    for col in range(8):
-                        piece = board[row][col]
-                        if piece and piece.colour != self.colour:
-                            piece_moves = piece.get_valid_moves(board)
-                            move_targets = [(move.to_row, move.to_col)
-                                            for move in piece_moves]
-                            if through_square in move_targets:
-                                raise BreakLoop
-                moves.append(move)
-            except BreakLoop:
-                pass
+                possible_moves.append((Move(self.row, self.col, row, 2,
+                                            self.piece_type, castling='queenside'), (self.row, 3)))
 
-
-class BreakLoop(Exception):
-    pass
+        opponent = Colour.BLACK if self.colour == Colour.WHITE else Colour.WHITE
+        for move, through_square in possible_moves:
+            # The king may not castle out of, or through, check
+            if not is_square_attacked(board, (self.row, self.col), opponent) and not is_square_attacked(board, through_square, opponent):
+                moves.append(move)
@@ -0,0 +1,63 @@
+from chess_game.enums import Colour, PieceType
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from chess_game.pieces import Piece
+
+KNIGHT_OFFSETS = [(-2, -1), (-2, 1), (-1, -2), (-1, 2),
+                  (1, -2), (1, 2), (2, -1), (2, 1)]
+KING_OFFSETS = [(-1, -1), (-1, 0), (-1, 1), (0, -1),
+                (0, 1), (1, -1), (1, 0), (1, 1)]
+ORTHOGONAL_DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+DIAGONAL_DIRECTIONS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+
+def is_square_attacked(board: List[List[Optional['Piece']]], square: Tuple[int, int], by_colour: Colour) -> bool:
+    """
+    Returns whether any `by_colour` piece attacks `square`.
+
+    Rather than generating the moves of every opposing piece, this looks outward from the square: a knight, king or
+    pawn can only attack it from a handful of squares, and a slider only from the first piece along each ray.
+
+    :param board: The current board state
+    :param square: A tuple of (row, col) of the square to test
+    :param by_colour: The colour of the attacking side
+    """
+    row, col = square
+
+    for dr, dc in KNIGHT_OFFSETS:
+        r, c = row + dr, col + dc
+        if 0 <= r < 8 and 0 <= c < 8:
+            piece = board[r][c]
+            if piece and piece.colour == by_colour and piece.piece_type == PieceType.KNIGHT:
+                return True
+
+    for dr, dc in KING_OFFSETS:
+        r, c = row + dr, col + dc
+        if 0 <= r < 8 and 0 <= c < 8:
+            piece = board[r][c]
+            if piece and piece.colour == by_colour and piece.piece_type == PieceType.KING:
+                return True
+
+    # White pawns move up the board, so they attack from the row below the square (and black from the row above)
+    r = row + 1 if by_colour == Colour.WHITE else row - 1
+    if 0 <= r < 8:
+        for c in (col - 1, col + 1):
+            if 0 <= c < 8:
+                piece = board[r][c]
+                if piece and piece.colour == by_colour and piece.piece_type == PieceType.PAWN:
+                    return True
+
+    for directions, slider in ((ORTHOGONAL_DIRECTIONS, PieceType.ROOK), (DIAGONAL_DIRECTIONS, PieceType.BISHOP)):
+        for dr, dc in directions:
+            r, c = row + dr, col + dc
+            while 0 <= r < 8 and 0 <= c < 8:
+                piece = board[r][c]
+                if piece:
+                    if piece.colour == by_colour and piece.piece_type in (slider, PieceType.QUEEN):
+                        return True
+                    break
+                r += dr
+                c += dc
+
+    return False
@@ -0,0 +1,132 @@
+"""
+A fixed-size transposition table for the search engine, keyed by `GameState.zobrist_key`.
+
+Entries live in one preallocated array of 64-bit words, so the memory used is set by the size given in MB and never
+grows. Each bucket holds two entries: a depth-preferred slot that keeps the deepest result from the current search,
+and an always-replace slot that takes everything else.
+"""
+from array import array
+from typing import Optional, Tuple
+
+# Bound types: whether the stored score is exact, or only a lower or upper bound on the true score
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+# Each entry is a key word and a data word; each bucket holds two entries
+WORDS_PER_ENTRY = 2
+ENTRIES_PER_BUCKET = 2
+ENTRY_BYTES = WORDS_PER_ENTRY * 8
+BUCKET_WORDS = WORDS_PER_ENTRY * ENTRIES_PER_BUCKET
+
+# Layout of the data word: move (16 bits) | depth (8) | bound (2) | valid (1) | generation (5) | score (32)
+_DEPTH_SHIFT = 16
+_BOUND_SHIFT = 24
+_VALID_BIT = 1 << 26
+_GENERATION_SHIFT = 27
+_GENERATION_MASK = 0x1F
+_SCORE_SHIFT = 32
+_SCORE_OFFSET = 1 << 31
+
+
+def pack_entry(depth: int, bound: int, score: int, move: int, generation: int) -> int:
+    """Packs an entry's fields into a single 64-bit data word."""
+    return (move | (depth << _DEPTH_SHIFT) | (bound << _BOUND_SHIFT) | _VALID_BIT
+            | (generation << _GENERATION_SHIFT) | ((score + _SCORE_OFFSET) << _SCORE_SHIFT))
+
+
+def unpack_entry(data: int) -> Tuple[int, int, int, int]:
+    """Returns the (depth, bound, score, move) stored in a data word."""
+    return ((data >> _DEPTH_SHIFT) & 0xFF, (data >> _BOUND_SHIFT) & 0x3,
+            (data >> _SCORE_SHIFT) - _SCORE_OFFSET, data & 0xFFFF)
+
+
+class TranspositionTable:
+    def __init__(self, size_mb: float = 16):
+        """
+        :param size_mb: The memory to preallocate for entries, in megabytes. The number of buckets is rounded down
+            to a power of two.
+        """
+        buckets = max(1, int(size_mb * 1024 * 1024) // (ENTRY_BYTES * ENTRIES_PER_BUCKET))
+        # Round down to a power of two so that a bucket is selected by masking the key
+        buckets = 1 << (buckets.bit_length() - 1)
+        self.bucket_mask = buckets - 1
+        self.capacity = buckets * ENTRIES_PER_BUCKET
+        self.table = array('Q', bytes(buckets * BUCKET_WORDS * 8))
+        self.generation = 0
+        self.used = 0
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.table) * self.table.itemsize
+
+    @property
+    def fill_rate(self) -> float:
+        """The fraction of entry slots in use."""
+        return self.used / self.capacity
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of probes that found an entry for their key."""
+        return self.hits / self.probes if self.probes else 0.0
+
+    def new_search(self) -> None:
+        """Starts a new search, so that entries from earlier searches give way to new ones in the depth slot."""
+        self.generation = (self.generation + 1) & _GENERATION_MASK
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def clear(self) -> None:
+        """Empties the table, keeping its memory."""
+        for index in range(len(self.table)):
+            self.table[index] = 0
+        self.used = 0
+        self.new_search()
+
+    def probe(self, key: int) -> Optional[Tuple[int, int, int, int]]:
+        """Returns the (depth, bound, score, move) stored for `key`, or None."""
+        self.probes += 1
+        table = self.table
+        index = (key & self.bucket_mask) * BUCKET_WORDS
+        if table[index] == key and table[index + 1]:
+            data = table[index + 1]
+        elif table[index + 2] == key and table[index + 3]:
+            data = table[index + 3]
+        else:
+            return None
+        self.hits += 1
+        return unpack_entry(data)
+
+    def store(self, key: int, depth: int, bound: int, score: int, move: int = 0) -> None:
+        """
+        Stores a search result for `key`.
+
+        The first slot of the bucket keeps the deepest result of the current search: it is replaced by a result
+        for the same key, one at least as deep, or when its entry is left over from an earlier search. Anything
+        else goes into the second slot, replacing whatever is there.
+
+        :param move: The best move found, packed into 16 bits (0 for none).
+        """
+        self.stores += 1
+        table = self.table
+        index = (key & self.bucket_mask) * BUCKET_WORDS
+        data = pack_entry(depth, bound, score, move, self.generation)
+        existing = table[index + 1]
+        if (not existing or table[index] == key or depth >= (existing >> _DEPTH_SHIFT) & 0xFF
+                or (existing >> _GENERATION_SHIFT) & _GENERATION_MASK != self.generation):
+            # Keep a displaced deeper entry for another key in the always-replace slot
+            if existing and table[index] != key:
+                self._write(index + 2, table[index], existing)
+            self._write(index, key, data)
+        else:
+            self._write(index + 2, key, data)
+
+    def _write(self, index: int, key: int, data: int) -> None:
+        if not self.table[index + 1]:
+            self.used += 1
+        self.table[index] = key
+        self.table[index + 1] = data
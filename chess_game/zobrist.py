@@ -0,0 +1,57 @@
+"""
+Zobrist hashing: a position's key is the XOR of a fixed random 64-bit number for each (colour, piece, square) on the
+board, plus numbers for the side to move, the castling rights and the en passant file.
+
+The numbers come from a seeded generator, so keys are stable across runs and processes.
+"""
+from chess_game.bitboard import COLOUR_INDEX, PIECE_INDEX
+from chess_game.enums import Colour
+import random
+
+_random = random.Random(0x5A0B5157)
+
+# PIECE_KEYS[colour][piece][square], indexed like `Bitboards.pieces` with squares as `row * 8 + col`
+PIECE_KEYS = [[[_random.getrandbits(64) for _ in range(64)] for _ in range(6)] for _ in range(2)]
+BLACK_TO_MOVE_KEY = _random.getrandbits(64)
+# One key per combination of the four castling rights, indexed by `castling_index`
+CASTLING_KEYS = [_random.getrandbits(64) for _ in range(16)]
+ENPASSANT_KEYS = [_random.getrandbits(64) for _ in range(8)]
+
+
+def castling_index(castling_rights: dict) -> int:
+    """Packs a `GameState.castling_rights` dictionary into a 4-bit number (K=1, Q=2, k=4, q=8)."""
+    white = castling_rights[Colour.WHITE]
+    black = castling_rights[Colour.BLACK]
+    return ((1 if white['kingside'] else 0) | (2 if white['queenside'] else 0)
+            | (4 if black['kingside'] else 0) | (8 if black['queenside'] else 0))
+
+
+def piece_key(piece, row: int, col: int) -> int:
+    """Returns the key for `piece` standing on (row, col)."""
+    return PIECE_KEYS[COLOUR_INDEX[piece.colour]][PIECE_INDEX[piece.piece_type]][row * 8 + col]
+
+
+def hash_pieces(board) -> int:
+    """Returns the XOR of the keys of every piece on a `GameState.board` style list of rows."""
+    key = 0
+    for row in range(8):
+        for col in range(8):
+            piece = board[row][col]
+            if piece:
+                key ^= piece_key(piece, row, col)
+    return key
+
+
+def state_key(turn: Colour, castling_rights: dict, enpassant_square) -> int:
+    """Returns the part of the key for the side to move, castling rights and en passant square."""
+    key = CASTLING_KEYS[castling_index(castling_rights)]
+    if turn == Colour.BLACK:
+        key ^= BLACK_TO_MOVE_KEY
+    if enpassant_square:
+        key ^= ENPASSANT_KEYS[enpassant_square[1]]
+    return key
+
+
+def compute_hash(game) -> int:
+    """Computes the Zobrist key of a GameState from scratch."""
+    return hash_pieces(game.board) ^ state_key(game.turn, game.castling_rights, game.enpassant_square)
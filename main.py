@@ -43,6 +43,9 @@ class ChessApp(QMainWindow):
         self.inCheckButton = QPushButton("Anyone in check?", self)
         self.inCheckButton.clicked.connect(self.print_in_check)
         self.button_layout.addWidget(self.inCheckButton)
+        self.takeBackButton = QPushButton("Take Back", self)
+        self.takeBackButton.clicked.connect(self.take_back)
+        self.button_layout.addWidget(self.takeBackButton)
         self.resetButton = QPushButton("Reset Game", self)
         self.resetButton.clicked.connect(self.reset_game)
         self.button_layout.addWidget(self.resetButton)
@@ -61,6 +64,11 @@ class ChessApp(QMainWindow):
     def print_in_check(self):
         self.chessBoard.print_in_check()
 
+    def take_back(self):
+        """Take back the last move and refresh the move history."""
+        if self.chessBoard.take_back_move():
+            self.update_move_history()
+
     def reset_game(self):
         """Show a confirmation dialog and reset the game if confirmed."""
         reply = QMessageBox.question(
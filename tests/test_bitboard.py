@@ -0,0 +1,118 @@
+import unittest
+import tests.test_game as game_tests
+import tests.test_pieces as piece_tests
+from chess_game.bitboard import (Bitboards, WHITE, BLACK, PAWN, ROOK, KING,
+                                 KNIGHT_ATTACKS, rook_attacks, square)
+from chess_game.enums import Backend, Colour
+from chess_game.game import GameState
+from chess_game.pieces import King, Rook, Pawn, Bishop
+
+
+class TestBitboards(unittest.TestCase):
+
+    def test_initial_position(self):
+        bitboards = Bitboards.from_board(GameState().board)
+        self.assertEqual(bin(bitboards.occupancy[WHITE]).count("1"), 16)
+        self.assertEqual(bin(bitboards.occupancy[BLACK]).count("1"), 16)
+        self.assertEqual(bitboards.pieces[WHITE][PAWN], 0xFF << 48)
+        self.assertEqual(bitboards.pieces[BLACK][PAWN], 0xFF << 8)
+        self.assertEqual(bitboards.king_square(WHITE), square(7, 4))
+        self.assertEqual(bitboards.king_square(BLACK), square(0, 4))
+
+    def test_knight_attacks_corner(self):
+        self.assertEqual(KNIGHT_ATTACKS[square(0, 0)],
+                         (1 << square(1, 2)) | (1 << square(2, 1)))
+
+    def test_rook_attacks_stop_at_blocker(self):
+        occupied = 1 << square(4, 2)
+        attacks = rook_attacks(square(4, 0), occupied)
+        self.assertTrue(attacks & (1 << square(4, 2)))
+        self.assertFalse(attacks & (1 << square(4, 3)))
+        self.assertEqual(bin(attacks).count("1"), 9)
+
+    def test_board_edits_resync(self):
+        game = GameState(Backend.BITBOARD)
+        self.assertFalse(game.is_king_in_check(Colour.WHITE))
+        game.board[6][4] = None
+        game.board[5][4] = Rook(Colour.BLACK, 5, 4)
+        self.assertTrue(game.is_king_in_check(Colour.WHITE))
+        self.assertEqual(game.bitboards.pieces[BLACK][ROOK] & (1 << square(5, 4)),
+                         1 << square(5, 4))
+
+
+class TestBackendsAgree(unittest.TestCase):
+
+    def assert_same_moves(self, mailbox: GameState, bitboard: GameState):
+        for row in range(8):
+            for col in range(8):
+                expected = {(m.to_row, m.to_col, m.en_passant, m.castling)
+                            for m in mailbox.get_valid_moves(row, col)}
+                actual = {(m.to_row, m.to_col, m.en_passant, m.castling)
+                          for m in bitboard.get_valid_moves(row, col)}
+                self.assertEqual(expected, actual, f"moves from ({row}, {col})")
+
+    def test_opening_sequence(self):
+        mailbox = GameState()
+        bitboard = GameState(Backend.BITBOARD)
+        sequence = [(6, 4, 4, 4), (1, 3, 3, 3), (4, 4, 3, 4), (1, 5, 3, 5),
+                    (3, 4, 2, 5), (0, 6, 2, 5), (7, 5, 4, 2), (2, 5, 4, 4)]
+        for from_row, from_col, to_row, to_col in sequence:
+            self.assert_same_moves(mailbox, bitboard)
+            for game in (mailbox, bitboard):
+                move = next(m for m in game.get_valid_moves(from_row, from_col)
+                            if m.to_row == to_row and m.to_col == to_col)
+                game.move_piece(move)
+        self.assert_same_moves(mailbox, bitboard)
+
+    def test_en_passant_pin(self):
+        bitboard = GameState(Backend.BITBOARD)
+        for row in range(8):
+            for col in range(8):
+                bitboard.board[row][col] = None
+        bitboard.board[3][0] = King(Colour.WHITE, 3, 0)
+        bitboard.board[0][4] = King(Colour.BLACK, 0, 4)
+        bitboard.board[3][1] = Pawn(Colour.WHITE, 3, 1)
+        bitboard.board[1][2] = Pawn(Colour.BLACK, 1, 2)
+        bitboard.board[3][7] = Rook(Colour.BLACK, 3, 7)
+        bitboard.turn = Colour.BLACK
+        move = next(m for m in bitboard.get_valid_moves(1, 2) if m.to_row == 3)
+        bitboard.move_piece(move)
+        # Taking en passant would uncover the rook's attack along the 5th rank
+        targets = [(m.to_row, m.to_col) for m in bitboard.get_valid_moves(3, 1)]
+        self.assertNotIn((2, 2), targets)
+        self.assertEqual(bitboard.bitboards.king_square(WHITE), square(3, 0))
+        self.assertTrue(bitboard.bitboards.pieces[WHITE][KING])
+
+
+class TestChessGameFlowBitboard(game_tests.TestChessGameFlow):
+
+    def setUp(self):
+        self.game = GameState(Backend.BITBOARD)
+
+
+class TestKingMovementBitboard(piece_tests.TestKingMovement):
+
+    def setUp(self):
+        self.game = GameState(Backend.BITBOARD)
+
+
+class TestPawnMovementBitboard(piece_tests.TestPawnMovement):
+
+    def setUp(self):
+        self.game = GameState(Backend.BITBOARD)
+
+
+class TestPinsAndCheckMaskBitboard(game_tests.TestPinsAndCheckMask):
+
+    def setUp(self):
+        self.game = GameState(Backend.BITBOARD)
+
+    def test_bitboard_masks(self):
+        self.empty_board(7, 4, 0, 0)
+        self.game.board[5][4] = Rook(Colour.WHITE, 5, 4)
+        self.game.board[1][4] = Rook(Colour.BLACK, 1, 4)
+        self.game.board[4][1] = Bishop(Colour.BLACK, 4, 1)
+        self.game.sync_board_state()
+        check_mask, pins = self.game.bitboards.checks_and_pins(WHITE)
+        self.assertEqual(set(pins), {square(5, 4)})
+        self.assertEqual(check_mask, sum(1 << square(r, c) for r, c in [(6, 3), (5, 2), (4, 1)]))
@@ -0,0 +1,86 @@
+import time
+import unittest
+from chess_game.engine import Engine, MATE_SCORE
+from chess_game.enums import Colour
+from chess_game.game import GameState
+from chess_game.move import Move
+from chess_game.perft import _load_fen
+
+
+class BaseTestEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = Engine()
+
+    def assert_best_move(self, fen: str, depth: int, from_row: int, from_col: int, to_row: int, to_col: int):
+        game = _load_fen(fen)
+        result = self.engine.search(game, depth=depth)
+        move = result.best_move
+        self.assertEqual((move.from_row, move.from_col, move.to_row, move.to_col),
+                         (from_row, from_col, to_row, to_col))
+        return result
+
+
+class TestEngine(BaseTestEngine):
+
+    def test_finds_back_rank_mate(self):
+        result = self.assert_best_move("6k1/5ppp/8/8/8/8/5PPP/3R2K1 w - - 0 1", 3, 7, 3, 0, 3)
+        self.assertEqual(result.score, MATE_SCORE - 1)
+        self.assertEqual(result.mate_in, 1)
+
+    def test_finds_mate_in_two(self):
+        # King and rook against king: 1. Kb6 Kb8 2. Rh8# (or 1. Kc7 Ka7 2. Ra1#)
+        game = _load_fen("k7/8/2K5/8/8/8/8/7R w - - 0 1")
+        result = self.engine.search(game, depth=4)
+        self.assertEqual(result.mate_in, 2)
+        self.assertEqual(len(result.pv), 3)
+        for move in result.pv:
+            game.move_piece(move)
+        self.assertTrue(game.is_checkmate)
+
+    def test_wins_hanging_queen(self):
+        self.assert_best_move("4k3/8/8/3q4/8/8/3R4/4K3 w - - 0 1", 2, 6, 3, 3, 3)
+
+    def test_reports_principal_variation(self):
+        game = GameState()
+        iterations = []
+        result = self.engine.search(game, depth=3, on_iteration=iterations.append)
+        self.assertEqual([r.depth for r in iterations], [1, 2, 3])
+        self.assertEqual(result.depth, 3)
+        self.assertEqual(len(result.pv), 3)
+        self.assertEqual(result.pv[0], result.best_move)
+        self.assertGreater(result.nodes, 20)
+        self.assertGreater(result.nps, 0)
+
+    def test_no_legal_moves(self):
+        game = _load_fen("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1")
+        result = self.engine.search(game, depth=3)
+        self.assertIsNone(result.best_move)
+        self.assertEqual(result.score, 0)
+
+
+class TestEngineBudget(BaseTestEngine):
+
+    def test_time_limit(self):
+        game = _load_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+        key = game.zobrist_key
+        start = time.perf_counter()
+        result = self.engine.search(game, time_limit=0.3)
+        self.assertLess(time.perf_counter() - start, 0.6)
+        self.assertIsInstance(result.best_move, Move)
+        # The position is restored after the search is cut off
+        self.assertEqual(game.zobrist_key, key)
+        self.assertEqual(game.history, [])
+        self.assertEqual(game.turn, Colour.WHITE)
+
+    def test_node_limit(self):
+        game = GameState()
+        result = self.engine.search(game, node_limit=500)
+        self.assertLessEqual(result.nodes, 500)
+        self.assertIsNotNone(result.best_move)
+        self.assertEqual(game.history, [])
+
+    def test_stop(self):
+        game = GameState()
+        self.engine.search(game, depth=1, on_iteration=lambda result: self.engine.stop())
+        self.assertTrue(self.engine.stopped)
@@ -324,3 +324,163 @@ class TestChessGameFlow(BaseTestChessGame):
         self.assertEqual(self.game.board[7][1].colour, Colour.BLACK)
         self.assertIsNone(self.game.board[6][0])
         self.assertFalse(self.game.is_checkmate)
+
+
+class TestUnmakeMove(BaseTestChessGame):
+
+    def snapshot(self):
+        board = [[(type(p), p.colour, p.row, p.col) if p else None for p in row]
+                 for row in self.game.board]
+        return (board, self.game.turn, self.game.enpassant_square, self.game.get_castling_state(),
+                self.game.in_check, self.game.is_checkmate, dict(self.game.king_positions),
+                list(self.game.history))
+
+    def test_unmake_without_moves(self):
+        self.assertIsNone(self.game.unmake_move())
+
+    def test_unmake_restores_sequence(self):
+        snapshots = [self.snapshot()]
+        # e4, d5, exd5, c5, dxc6 (en passant), Nf6, cxb7, Bg4, bxa8=Q, Be2, Kxe2
+        for from_row, from_col, to_row, to_col in [(6, 4, 4, 4), (1, 3, 3, 3), (4, 4, 3, 3), (1, 2, 3, 2),
+                                                   (3, 3, 2, 2), (0, 6, 2, 5), (2, 2, 1, 1), (0, 2, 4, 6)]:
+            self.move_piece(from_row, from_col, to_row, to_col)
+            snapshots.append(self.snapshot())
+        promotion = self.get_move_from_target(1, 1, 0, 0)
+        promotion.promotion = PieceType.QUEEN
+        self.game.move_piece(promotion)
+        self.assertIsInstance(self.game.board[0][0], Queen)
+        snapshots.append(self.snapshot())
+        self.move_piece(4, 6, 6, 4)
+        snapshots.append(self.snapshot())
+        self.move_piece(7, 4, 6, 4)
+        self.assertEqual(self.game.king_positions[Colour.WHITE], (6, 4))
+        self.assertFalse(self.game.castling_rights[Colour.WHITE]['kingside'])
+        self.assertFalse(self.game.castling_rights[Colour.BLACK]['queenside'])
+
+        while snapshots:
+            self.game.unmake_move()
+            self.assertEqual(self.snapshot(), snapshots.pop())
+        self.assertIsNone(self.game.unmake_move())
+
+    def test_unmake_castling(self):
+        self.game.board[7][5] = None
+        self.game.board[7][6] = None
+        before = self.snapshot()
+        self.move_piece(7, 4, 7, 6)
+        self.assertIsInstance(self.game.board[7][5], Rook)
+        self.assertEqual(self.game.unmake_move().castling, 'kingside')
+        self.assertEqual(self.snapshot(), before)
+        self.assertIsInstance(self.game.board[7][7], Rook)
+        self.assert_move_possible(7, 4, 7, 6)
+
+    def test_unmake_checkmate(self):
+        for from_row, from_col, to_row, to_col in [(6, 5, 5, 5), (1, 4, 3, 4), (6, 6, 4, 6)]:
+            self.move_piece(from_row, from_col, to_row, to_col)
+        before = self.snapshot()
+        self.move_piece(0, 3, 4, 7)
+        self.assertTrue(self.game.is_checkmate)
+        self.game.unmake_move()
+        self.assertEqual(self.snapshot(), before)
+        self.assertFalse(self.game.is_checkmate)
+        self.assertIsNone(self.game.in_check)
+
+
+class TestSquareAttacked(BaseTestChessGame):
+
+    def test_initial_position(self):
+        # The third rank is covered by White's pawns and pieces, the fourth is not
+        for col in range(8):
+            self.assertTrue(self.game.is_square_attacked((5, col), Colour.WHITE))
+            self.assertFalse(self.game.is_square_attacked((4, col), Colour.WHITE))
+            self.assertTrue(self.game.is_square_attacked((2, col), Colour.BLACK))
+
+    def test_pawn_attacks_diagonally_forward(self):
+        self.empty_board()
+        self.game.board[4][4] = Pawn(Colour.WHITE, 4, 4)
+        self.assertTrue(self.game.is_square_attacked((3, 3), Colour.WHITE))
+        self.assertTrue(self.game.is_square_attacked((3, 5), Colour.WHITE))
+        self.assertFalse(self.game.is_square_attacked((3, 4), Colour.WHITE))
+        self.assertFalse(self.game.is_square_attacked((5, 3), Colour.WHITE))
+
+    def test_sliders_are_blocked(self):
+        self.empty_board()
+        self.game.board[4][0] = Rook(Colour.BLACK, 4, 0)
+        self.game.board[2][2] = Queen(Colour.BLACK, 2, 2)
+        self.assertTrue(self.game.is_square_attacked((4, 7), Colour.BLACK))
+        self.assertTrue(self.game.is_square_attacked((6, 6), Colour.BLACK))
+        self.game.board[4][3] = Knight(Colour.WHITE, 4, 3)
+        self.assertFalse(self.game.is_square_attacked((4, 7), Colour.BLACK))
+        self.assertTrue(self.game.is_square_attacked((6, 4), Colour.WHITE))
+        self.assertFalse(self.game.is_square_attacked((6, 4), Colour.BLACK))
+
+    def test_check_uses_tracked_king_position(self):
+        self.empty_board(7, 4, 0, 4)
+        self.game.board[6][7] = Rook(Colour.WHITE, 6, 7)
+        self.move_piece(7, 4, 7, 5)
+        self.assertEqual(self.game.king_positions[Colour.WHITE], (7, 5))
+        self.game.board[3][5] = Rook(Colour.BLACK, 3, 5)
+        self.assertTrue(self.game.is_king_in_check(Colour.WHITE))
+        self.assertFalse(self.game.is_king_in_check(Colour.BLACK))
+
+
+class TestPinsAndCheckMask(BaseTestChessGame):
+
+    def test_pinned_piece_moves_along_pin_line(self):
+        self.empty_board(7, 4, 0, 0)
+        self.game.board[5][4] = Rook(Colour.WHITE, 5, 4)
+        self.game.board[1][4] = Rook(Colour.BLACK, 1, 4)
+        self.game.board[6][3] = Knight(Colour.WHITE, 6, 3)
+        self.game.board[3][0] = Queen(Colour.BLACK, 3, 0)
+        # The rook can slide towards or capture the pinning rook, the knight cannot move at all
+        self.assert_number_of_moves(5, 4, 5)
+        self.assert_move_possible(5, 4, 1, 4)
+        self.assert_move_not_possible(5, 4, 5, 3)
+        self.assert_number_of_moves(6, 3, 0)
+        pins, check_mask = self.game.get_pins_and_check_mask(Colour.WHITE)
+        self.assertEqual(set(pins), {(5, 4), (6, 3)})
+        self.assertIsNone(check_mask)
+
+    def test_single_check_must_be_blocked_or_captured(self):
+        self.empty_board(7, 4, 0, 0)
+        self.game.board[3][4] = Rook(Colour.BLACK, 3, 4)
+        self.game.board[5][0] = Rook(Colour.WHITE, 5, 0)
+        self.game.board[3][7] = Queen(Colour.WHITE, 3, 7)
+        self.assertEqual(self.game.get_pins_and_check_mask(Colour.WHITE)[1],
+                         {(6, 4), (5, 4), (4, 4), (3, 4)})
+        self.assert_number_of_moves(5, 0, 1)
+        self.assert_move_possible(5, 0, 5, 4)
+        self.assert_number_of_moves(3, 7, 2)
+        self.assert_move_possible(3, 7, 3, 4)
+        self.assert_move_possible(3, 7, 6, 4)
+
+    def test_double_check_only_king_moves(self):
+        self.empty_board(7, 4, 0, 0)
+        self.game.board[3][4] = Rook(Colour.BLACK, 3, 4)
+        self.game.board[5][3] = Knight(Colour.BLACK, 5, 3)
+        self.game.board[5][0] = Rook(Colour.WHITE, 5, 0)
+        self.assertEqual(self.game.get_pins_and_check_mask(Colour.WHITE)[1], set())
+        self.assert_number_of_moves(5, 0, 0)
+        # The king cannot step back along the rook's line either
+        self.assert_move_not_possible(7, 4, 6, 4)
+        self.assert_move_possible(7, 4, 7, 5)
+
+    def test_en_passant_discovered_check_along_rank(self):
+        self.empty_board(3, 0, 0, 4)
+        self.game.board[3][1] = Pawn(Colour.WHITE, 3, 1)
+        self.game.board[1][2] = Pawn(Colour.BLACK, 1, 2)
+        self.game.board[3][7] = Rook(Colour.BLACK, 3, 7)
+        self.game.turn = Colour.BLACK
+        self.move_piece(1, 2, 3, 2)
+        self.assertEqual(self.game.enpassant_square, (2, 2))
+        self.assert_move_not_possible(3, 1, 2, 2)
+        self.assert_move_possible(3, 1, 2, 1)
+
+    def test_en_passant_captures_checking_pawn(self):
+        self.empty_board(4, 3, 0, 4)
+        self.game.board[3][3] = Pawn(Colour.WHITE, 3, 3)
+        self.game.board[1][4] = Pawn(Colour.BLACK, 1, 4)
+        self.game.turn = Colour.BLACK
+        self.move_piece(1, 4, 3, 4)
+        self.assertEqual(self.game.in_check, Colour.WHITE)
+        self.assert_number_of_moves(3, 3, 1)
+        self.assert_move_possible(3, 3, 2, 4)
@@ -0,0 +1,65 @@
+import unittest
+from chess_game.enums import Colour, PieceType
+from chess_game.engine import Engine
+from chess_game.move_ordering import MoveOrderer, move_squares
+from chess_game.perft import _load_fen
+
+
+class TestMoveOrdering(unittest.TestCase):
+
+    def setUp(self):
+        self.orderer = MoveOrderer()
+
+    def test_captures_by_mvv_lva(self):
+        # The white pawn and knight can both take the queen, and the knight can also take a pawn
+        game = _load_fen("4k3/8/8/3q1p2/4P3/2N5/8/4K3 w - - 0 1")
+        moves = self.orderer.order(game.get_all_valid_moves(), 0, Colour.WHITE)
+        captures = [(move.piece_type, move.captured_piece.piece_type) for move in moves[:3]]
+        self.assertEqual(captures, [(PieceType.PAWN, PieceType.QUEEN), (PieceType.KNIGHT, PieceType.QUEEN),
+                                    (PieceType.PAWN, PieceType.PAWN)])
+        self.assertTrue(all(move.captured_piece is None for move in moves[3:]))
+
+    def test_first_move_searched_first(self):
+        game = _load_fen("4k3/8/8/3q4/4P3/2N5/8/4K3 w - - 0 1")
+        quiet = next(move for move in game.get_all_valid_moves() if move.piece_type == PieceType.KING)
+        moves = self.orderer.order(game.get_all_valid_moves(), 0, Colour.WHITE, quiet)
+        self.assertEqual(move_squares(moves[0]), move_squares(quiet))
+
+    def test_killers_then_history(self):
+        game = _load_fen("4k3/8/8/3q4/4P3/2N5/8/4K3 w - - 0 1")
+        moves = game.get_all_valid_moves()
+        quiet = [move for move in moves if move.captured_piece is None]
+        killer, favourite = quiet[-1], quiet[-2]
+        self.orderer.record_cutoff(killer, 1, 3, Colour.WHITE)
+        for _ in range(3):
+            self.orderer.record_cutoff(favourite, 4, 5, Colour.WHITE)
+        ordered = self.orderer.order(moves, 3, Colour.WHITE)
+        self.assertEqual(ordered[0].captured_piece.piece_type, PieceType.QUEEN)
+        self.assertEqual(ordered[1].captured_piece.piece_type, PieceType.QUEEN)
+        self.assertEqual(move_squares(ordered[2]), move_squares(killer))
+        self.assertEqual(move_squares(ordered[3]), move_squares(favourite))
+        # Killers are kept per ply, while history is shared between plies
+        self.assertEqual(move_squares(self.orderer.order(moves, 4, Colour.WHITE)[2]), move_squares(favourite))
+
+    def test_captures_never_recorded(self):
+        game = _load_fen("4k3/8/8/3q4/4P3/2N5/8/4K3 w - - 0 1")
+        capture = next(move for move in game.get_all_valid_moves() if move.captured_piece)
+        self.orderer.record_cutoff(capture, 4, 0, Colour.WHITE)
+        self.assertEqual(self.orderer.killers[0], [-1, -1])
+        self.assertFalse(any(self.orderer.history[Colour.WHITE]))
+
+    def test_new_search_ages_history(self):
+        game = _load_fen("4k3/8/8/8/8/8/8/4K3 w - - 0 1")
+        move = game.get_all_valid_moves()[0]
+        self.orderer.record_cutoff(move, 4, 2, Colour.WHITE)
+        self.orderer.new_search()
+        self.assertEqual(self.orderer.killers[2], [-1, -1])
+        self.assertEqual(self.orderer.history[Colour.WHITE][move_squares(move)], 8)
+
+    def test_ordering_reduces_nodes(self):
+        game = _load_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+        engine = Engine(max_depth=3)
+        ordered = engine.search(game)
+        engine.move_orderer.order = lambda moves, ply, colour, first_move=None: moves
+        unordered = engine.search(game)
+        self.assertLess(ordered.nodes, unordered.nodes)
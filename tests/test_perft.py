@@ -0,0 +1,55 @@
+import unittest
+from chess_game.enums import Backend, PieceType
+from chess_game.move import Move
+from chess_game.perft import STANDARD_POSITIONS, _load_fen, divide, main, move_to_uci, perft
+
+
+class BaseTestPerft(unittest.TestCase):
+    backend = Backend.MAILBOX
+
+    def assert_perft(self, name: str, depth: int):
+        fen, expected_counts = STANDARD_POSITIONS[name]
+        game = _load_fen(fen, self.backend)
+        self.assertEqual(perft(game, depth), expected_counts[depth - 1])
+
+
+class TestPerft(BaseTestPerft):
+
+    def test_initial_position(self):
+        self.assert_perft("initial", 3)
+
+    def test_kiwipete(self):
+        # Castling both sides, en passant, pins and promotions
+        self.assert_perft("kiwipete", 2)
+
+    def test_position3(self):
+        # En passant captures that would expose the king along the rank
+        self.assert_perft("position3", 3)
+
+    def test_position4(self):
+        # Promotions with capture and castling rights lost to a captured rook
+        self.assert_perft("position4", 2)
+
+    def test_position5(self):
+        self.assert_perft("position5", 2)
+
+    def test_divide_sums_to_perft(self):
+        game = _load_fen(STANDARD_POSITIONS["position3"][0], self.backend)
+        counts = divide(game, 2)
+        self.assertEqual(len(counts), 14)
+        self.assertEqual(sum(counts.values()), 191)
+        self.assertEqual(counts["b4f4"], 2)
+
+    def test_move_to_uci(self):
+        self.assertEqual(move_to_uci(Move(6, 4, 4, 4, PieceType.PAWN)), "e2e4")
+        self.assertEqual(move_to_uci(Move(1, 0, 0, 0, PieceType.PAWN, promotion=PieceType.KNIGHT)), "a7a8n")
+
+    def test_cli(self):
+        self.assertEqual(main(["--depth", "2", "--position", "position3", "--backend", self.backend.value]), 0)
+
+
+class TestPerftBitboard(TestPerft):
+    backend = Backend.BITBOARD
+
+    def test_kiwipete(self):
+        self.assert_perft("kiwipete", 3)
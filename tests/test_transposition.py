@@ -0,0 +1,73 @@
+import unittest
+from chess_game.engine import Engine, MATE_SCORE, score_from_table, score_to_table
+from chess_game.game import GameState
+from chess_game.transposition import (TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND,
+                                      pack_entry, unpack_entry)
+
+
+class TestTranspositionTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = TranspositionTable(size_mb=1)
+
+    def test_fixed_memory(self):
+        self.assertEqual(self.table.size_bytes, 1024 * 1024)
+        self.assertEqual(self.table.capacity, 1024 * 1024 // 16)
+        self.assertEqual(TranspositionTable(size_mb=0.01).capacity, 512)
+
+    def test_pack_round_trip(self):
+        for depth, bound, score, move in [(0, EXACT, 0, 0), (12, LOWER_BOUND, -MATE_SCORE + 3, 0xFFFF),
+                                          (255, UPPER_BOUND, 31415, 1234)]:
+            self.assertEqual(unpack_entry(pack_entry(depth, bound, score, move, 7)), (depth, bound, score, move))
+
+    def test_store_and_probe(self):
+        self.assertIsNone(self.table.probe(0x1234))
+        self.table.store(0x1234, 5, EXACT, -250, 42)
+        self.assertEqual(self.table.probe(0x1234), (5, EXACT, -250, 42))
+        self.assertEqual(self.table.hit_rate, 0.5)
+        self.assertEqual(self.table.used, 1)
+
+    def test_depth_preferred_replacement(self):
+        buckets = self.table.bucket_mask + 1
+        deep, shallow, other = 7, 7 + buckets, 7 + 2 * buckets
+        self.table.store(deep, 8, EXACT, 1)
+        # A shallower result for another key in the same bucket goes to the always-replace slot
+        self.table.store(shallow, 2, EXACT, 2)
+        self.assertEqual(self.table.probe(deep)[0], 8)
+        self.assertEqual(self.table.probe(shallow)[0], 2)
+        # ... and is replaced by the next shallow result, while the deep entry survives
+        self.table.store(other, 1, EXACT, 3)
+        self.assertIsNone(self.table.probe(shallow))
+        self.assertEqual(self.table.probe(deep)[0], 8)
+        self.assertEqual(self.table.used, 2)
+        # In a new search, old entries give way in the depth-preferred slot
+        self.table.new_search()
+        self.table.store(shallow, 1, EXACT, 4)
+        self.assertEqual(self.table.probe(shallow)[2], 4)
+        self.assertEqual(self.table.probe(deep)[0], 8)
+
+    def test_clear(self):
+        self.table.store(99, 3, EXACT, 0)
+        self.table.clear()
+        self.assertIsNone(self.table.probe(99))
+        self.assertEqual(self.table.fill_rate, 0.0)
+
+    def test_mate_scores_are_stored_relative_to_node(self):
+        score = MATE_SCORE - 5
+        self.assertEqual(score_to_table(score, 3), MATE_SCORE - 2)
+        self.assertEqual(score_from_table(score_to_table(score, 3), 3), score)
+        self.assertEqual(score_from_table(score_to_table(-score, 2), 4), -score + 2)
+        self.assertEqual(score_to_table(150, 9), 150)
+
+
+class TestEngineTransposition(unittest.TestCase):
+
+    def test_second_search_reuses_table(self):
+        engine = Engine(hash_mb=1)
+        game = GameState()
+        first = engine.search(game, depth=3)
+        self.assertGreater(engine.transposition_table.fill_rate, 0)
+        second = engine.search(game, depth=3)
+        self.assertGreater(engine.transposition_table.hit_rate, 0)
+        self.assertLess(second.nodes, first.nodes)
+        self.assertEqual(second.score, first.score)
@@ -0,0 +1,61 @@
+import unittest
+from chess_game.enums import Backend, Colour
+from chess_game.game import GameState
+from chess_game.move import Move
+from chess_game.pieces import Knight
+from chess_game.zobrist import compute_hash
+
+
+class TestZobrist(unittest.TestCase):
+
+    def setUp(self):
+        self.game = GameState()
+
+    def play(self, game: GameState, *moves):
+        for from_row, from_col, to_row, to_col in moves:
+            move = Move.get_move_from_list(game.get_valid_moves(from_row, from_col), to_row, to_col)
+            self.assertIsNotNone(move)
+            game.move_piece(move)
+            self.assertEqual(game.zobrist_key, compute_hash(game))
+
+    def test_stable_across_games(self):
+        self.assertEqual(self.game.zobrist_key, GameState().zobrist_key)
+        self.assertEqual(self.game.zobrist_key, GameState(Backend.BITBOARD).zobrist_key)
+
+    def test_transpositions_share_a_key(self):
+        other = GameState()
+        # 1. Nf3 Nf6 2. Nc3 Nc6 and 1. Nc3 Nc6 2. Nf3 Nf6
+        self.play(self.game, (7, 6, 5, 5), (0, 6, 2, 5), (7, 1, 5, 2), (0, 1, 2, 2))
+        self.play(other, (7, 1, 5, 2), (0, 1, 2, 2), (7, 6, 5, 5), (0, 6, 2, 5))
+        self.assertEqual(self.game.zobrist_key, other.zobrist_key)
+
+    def test_side_to_move_castling_and_en_passant(self):
+        start = self.game.zobrist_key
+        self.game.swap_turn()
+        self.assertNotEqual(self.game.zobrist_key, start)
+        self.game.swap_turn()
+        self.game.castling_rights[Colour.BLACK]['queenside'] = False
+        self.assertNotEqual(self.game.zobrist_key, start)
+        self.game.castling_rights[Colour.BLACK]['queenside'] = True
+        self.assertEqual(self.game.zobrist_key, start)
+        # e4 sets an en passant square, so it differs from reaching the same squares in two single steps
+        self.play(self.game, (6, 4, 4, 4))
+        with_enpassant = self.game.zobrist_key
+        self.game.enpassant_square = None
+        self.assertNotEqual(self.game.zobrist_key, with_enpassant)
+
+    def test_unmake_restores_key(self):
+        keys = [self.game.zobrist_key]
+        for move in [(6, 4, 4, 4), (1, 3, 3, 3), (4, 4, 3, 3), (0, 3, 3, 3)]:
+            self.play(self.game, move)
+            keys.append(self.game.zobrist_key)
+        while self.game.unmake_move():
+            keys.pop()
+            self.assertEqual(self.game.zobrist_key, keys[-1])
+
+    def test_board_edits_rehash(self):
+        start = self.game.zobrist_key
+        self.game.board[7][6] = None
+        self.game.board[5][5] = Knight(Colour.WHITE, 5, 5)
+        self.assertNotEqual(self.game.zobrist_key, start)
+        self.assertEqual(self.game.zobrist_key, compute_hash(self.game))
@@ -47,6 +47,16 @@ class ChessBoard(QWidget):
         self.update()
         self.repaint()
 
+    def take_back_move(self) -> bool:
+        """Takes back the last move, returning whether there was one to take back."""
+        if self.game_state.unmake_move() is None:
+            return False
+        self.clear_labels()
+        self.clear_selection()
+        self.setup_chessboard()
+        self.update()
+        return True
+
     def setup_chessboard(self):
         """Draws the board and pieces based on `self.game_state` state."""
         for row in range(8):
@@ -2,7 +2,6 @@ from chess_game.enums import PieceType
 from chess_game.game import GameState
 from chess_game.move import Move
 from typing import List
-import copy
 
 
 def to_algebraic_notation(move: Move, game: GameState) -> str:
@@ -56,12 +55,13 @@ def to_algebraic_notation(move: Move, game: GameState) -> str:
     if move.promotion:
         move_str += "=" + piece_notation.get(move.promotion, '')
 
-    temp_game_copy = copy.deepcopy(game)
-    temp_game_copy.move_piece(move)
-    if temp_game_copy.is_checkmate:
-        move_str += '#'
-    elif temp_game_copy.in_check:
-        move_str += '+'
+    # Play the move to find out whether it gives check or mate, then take it back
+    if game.move_piece(move):
+        if game.is_checkmate:
+            move_str += '#'
+        elif game.in_check:
+            move_str += '+'
+        game.unmake_move()
 
     return move_str
 